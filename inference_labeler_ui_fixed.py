@@ -446,13 +446,20 @@ class SetupWindow(QtWidgets.QDialog):
         
         self.inference_radio = QtWidgets.QRadioButton("Inference Results")
         self.inference_radio.setChecked(True)
-        self.inference_radio.toggled.connect(self._on_type_changed)
         type_buttons_layout.addWidget(self.inference_radio)
         
         self.report_radio = QtWidgets.QRadioButton("Report")
-        self.report_radio.toggled.connect(self._on_type_changed)
         type_buttons_layout.addWidget(self.report_radio)
         
+        # 라디오마다 toggled를 연결하면 선택 변경 한 번에 핸들러가 두 번 실행되므로
+        # 그룹 신호에서 체크된 버튼에 대해서만 한 번 처리
+        self._type_group = QtWidgets.QButtonGroup(self)
+        self._type_group.addButton(self.inference_radio)
+        self._type_group.addButton(self.report_radio)
+        self._type_group.buttonToggled.connect(
+            lambda _button, checked: checked and self._on_type_changed()
+        )
+        
         type_layout.addLayout(type_buttons_layout)
         layout.addWidget(type_group)
 
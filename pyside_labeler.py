@@ -16,8 +16,10 @@ except Exception:
 from typing import Dict, List, Optional, Tuple
 import argparse
 import gc
+import time
 import psutil
 
+import numpy as np
 import pandas as pd
 from PySide6 import QtCore, QtGui, QtWidgets
 
@@ -25,15 +27,33 @@ from openpyxl import load_workbook
 
 # Reuse path resolution from the existing module
 from create_excel_from_seg_csv import resolve_image_path, normalize_relative_path
+try:
+    # Optional: backs high-cardinality text columns with Arrow strings
+    import pyarrow  # noqa: F401
+    _TEXT_DTYPE: Optional[str] = "string[pyarrow]"
+except ImportError:
+    _TEXT_DTYPE = None
 import glob
+from collections import OrderedDict, deque
 
 
 # Memory management utilities
-def get_memory_usage():
-    """Get current memory usage in MB"""
+_MEM_SAMPLE_TTL = 0.5  # seconds; RSS is re-read at most this often
+_last_mem: float = 0.0
+_last_mem_t: Optional[float] = None
+
+
+def get_memory_usage(fresh: bool = False):
+    """Get current memory usage in MB (sampled at most every 500 ms unless fresh=True)"""
+    global _last_mem, _last_mem_t
+    now = time.monotonic()
+    if not fresh and _last_mem_t is not None and now - _last_mem_t < _MEM_SAMPLE_TTL:
+        return _last_mem
     try:
         process = psutil.Process(os.getpid())
-        return process.memory_info().rss / 1024 / 1024
+        _last_mem = process.memory_info().rss / 1024 / 1024
+        _last_mem_t = now
+        return _last_mem
     except:
         return 0
 
@@ -45,12 +65,18 @@ def force_garbage_collection():
     """Force garbage collection to free memory"""
     gc.collect()
 
+_SYSTEM_MEM_TOTAL: Optional[float] = None
+
+
 def get_system_memory():
-    """Get total system memory in MB"""
-    try:
-        return psutil.virtual_memory().total / 1024 / 1024
-    except:
-        return 8192  # Default to 8GB if can't detect
+    """Get total system memory in MB (read once; it does not change while running)"""
+    global _SYSTEM_MEM_TOTAL
+    if _SYSTEM_MEM_TOTAL is None:
+        try:
+            _SYSTEM_MEM_TOTAL = psutil.virtual_memory().total / 1024 / 1024
+        except:
+            return 8192  # Default to 8GB if can't detect
+    return _SYSTEM_MEM_TOTAL
 
 
 def parse_pred_list(value) -> List[str]:
@@ -86,6 +112,87 @@ def ensure_object_dtype(df: pd.DataFrame, column: str) -> None:
         pass
 
 
+# Read-only, low-cardinality text columns kept as Categorical after load
+CATEGORY_COLUMNS: Tuple[str, ...] = ("origin_class", "pred_seg_results")
+
+
+def ensure_category_dtype(df: pd.DataFrame, column: str) -> None:
+    """Store column as Categorical with str categories (NaN stays missing)."""
+    try:
+        s = df[column]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            return
+        df[column] = s.where(s.isna(), s.astype(str)).astype("category")
+    except Exception:
+        pass
+
+
+# Read-only, mostly unique path columns; Arrow-backed when pyarrow is installed
+TEXT_COLUMNS: Tuple[str, ...] = ("img_path", "filename")
+
+
+def ensure_text_dtype(df: pd.DataFrame, column: str) -> None:
+    """Store column as Arrow strings (one buffer, no per-row PyObject); no-op without pyarrow."""
+    if _TEXT_DTYPE is None:
+        return
+    try:
+        s = df[column]
+        if s.dtype == _TEXT_DTYPE:
+            return
+        df[column] = s.where(s.isna(), s.astype(str)).astype(_TEXT_DTYPE)
+    except Exception:
+        pass
+
+
+def as_categorical(values: pd.Series) -> pd.Series:
+    return values if isinstance(values.dtype, pd.CategoricalDtype) else values.astype("category")
+
+
+def build_pred_index(values: pd.Series, parsed_categories: Optional[List[List[str]]] = None) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """Inverted index over pred_seg_results: item -> row bitmap, plus per-row item counts.
+
+    Each distinct value is parsed once and rows share the result through category codes;
+    pass parsed_categories (aligned with the categories) to reuse an earlier parse.
+    """
+    cat = as_categorical(values)
+    if parsed_categories is None:
+        parsed_categories = [parse_pred_list(v) for v in cat.cat.categories]
+    parsed = [set(p) for p in parsed_categories]
+    n_cats = len(parsed)
+    # Missing values (code -1) point at a trailing empty slot
+    codes = cat.cat.codes.to_numpy()
+    codes = np.where(codes < 0, n_cats, codes)
+    counts = np.array([len(p) for p in parsed] + [0], dtype=np.int32)[codes]
+    index: Dict[str, np.ndarray] = {}
+    for item in set().union(*parsed):
+        has = np.fromiter((item in p for p in parsed), dtype=bool, count=n_cats)
+        index[item] = np.append(has, False)[codes]
+    return index, counts
+
+
+def stable_sort_order(values: pd.Series, descending: bool = False) -> np.ndarray:
+    """Stable argsort of a Series with missing values last, matching sort_values(kind="stable").
+
+    Categorical/numeric columns sort on their backing ndarray; object columns are
+    factorized to sorted codes first (mixed types compare as strings).
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy()
+        keys = np.where(codes < 0, np.nan, codes.astype(np.float64)) if (codes < 0).any() else codes.astype(np.int64)
+    elif pd.api.types.is_integer_dtype(values.dtype) and not values.hasnans:
+        keys = values.to_numpy(dtype=np.int64)
+    elif pd.api.types.is_numeric_dtype(values.dtype):
+        keys = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        try:
+            codes, _ = pd.factorize(values, sort=True)
+        except TypeError:
+            codes, _ = pd.factorize(values.where(values.isna(), values.astype(str)), sort=True)
+        keys = np.where(codes < 0, np.nan, codes.astype(np.float64)) if (codes < 0).any() else codes
+    # NaN stays last under negation, and ties keep their original order either way
+    return np.argsort(-keys if descending else keys, kind="stable")
+
+
 def default_json_path(xlsx_path: str) -> str:
     base = os.path.basename(xlsx_path)
     root, _ = os.path.splitext(base)
@@ -104,21 +211,144 @@ def default_json_path(xlsx_path: str) -> str:
     return new_path
 
 
-def load_label_store(json_path: str) -> dict:
-    if not json_path or not os.path.exists(json_path):
-        return {"version": 1, "updated_at": None, "labels": {}}
+# Label edits are appended to "<json>.wal" (one JSON op per line) and folded into the
+# store itself on compaction, export-time saves, or window close.
+LABEL_LOG_SUFFIX = ".wal"
+LABEL_LOG_COMPACT_OPS = 500
+
+
+def row_identity_keys(row: pd.Series) -> Dict[str, str]:
+    """img_path/filename of a frame row as stored with its labels; missing values give ""."""
+    keys: Dict[str, str] = {}
+    for col in ("img_path", "filename"):
+        value = row.get(col, "")
+        # pd.NA from Arrow-backed text columns would otherwise be stored as "<NA>"
+        keys[col] = "" if value is None or pd.isna(value) else str(value)
+    return keys
+
+
+def apply_label_op(store: dict, kind: str, row_idx: int, payload: Dict[str, object], keys_for_row: Dict[str, str]) -> None:
+    key = str(row_idx)
+    entry = store["labels"].get(key) or {}
+    # Ensure identity keys present
+    for k, v in keys_for_row.items():
+        entry[k] = v
+    if kind == "values":
+        vals = entry.get("values") or {}
+        for k, v in payload.items():
+            vals[k] = v
+        entry["values"] = vals
+    else:
+        for k, v in payload.items():
+            entry[k] = v
+    store["labels"][key] = entry
+
+
+def append_label_ops(json_path: str, ops: List[Tuple[str, int, Dict[str, object], Dict[str, str]]]) -> bool:
+    """Append queued ops to the store's log and fsync. Returns True on success."""
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, dict) and "labels" in data:
-                return data
+        os.makedirs(os.path.dirname(json_path) or ".", exist_ok=True)
+        lines = "".join(
+            json.dumps({"kind": kind, "row": row_idx, "payload": payload, "keys": keys}, ensure_ascii=False) + "\n"
+            for kind, row_idx, payload, keys in ops
+        )
+        with open(json_path + LABEL_LOG_SUFFIX, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        return True
     except Exception:
+        return False
+
+
+def count_label_ops(json_path: str) -> int:
+    """Number of ops currently in the store's log (0 when there is none)."""
+    try:
+        with open(json_path + LABEL_LOG_SUFFIX, "rb") as f:
+            return sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 16), b""))
+    except OSError:
+        return 0
+
+
+def _replay_label_log(json_path: str, store: dict) -> None:
+    try:
+        with open(json_path + LABEL_LOG_SUFFIX, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    op = json.loads(line)
+                    apply_label_op(store, op["kind"], op["row"], op["payload"], op.get("keys") or {})
+                except Exception:
+                    continue  # torn last line after a crash
+    except OSError:
         pass
-    return {"version": 1, "updated_at": None, "labels": {}}
+
+
+def load_label_store(json_path: str) -> dict:
+    """Load the JSON label store with any logged ops applied on top."""
+    store = {"version": 1, "updated_at": None, "labels": {}}
+    if not json_path:
+        return store
+    if os.path.exists(json_path):
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+                if isinstance(data, dict) and "labels" in data:
+                    store = data
+        except Exception:
+            pass
+    _replay_label_log(json_path, store)
+    return store
+
+
+def compact_label_store(json_path: str) -> bool:
+    """Fold the op log into the JSON store, then drop the log (the only place it is removed)."""
+    if not os.path.exists(json_path + LABEL_LOG_SUFFIX):
+        return True
+    if not save_label_store(json_path, load_label_store(json_path)):
+        return False
+    try:
+        os.remove(json_path + LABEL_LOG_SUFFIX)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return False
+    return True
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+# json_path -> (stamps of store and log, parsed store)
+_label_store_cache: Dict[str, Tuple[tuple, dict]] = {}
+
+
+def load_label_store_cached(json_path: str) -> dict:
+    """Like load_label_store, but reuses the parsed store while the file and its log are unchanged.
+
+    The returned dict is shared between callers and must be treated as read-only.
+    """
+    if not json_path:
+        return load_label_store(json_path)
+    stamp = (_file_stamp(json_path), _file_stamp(json_path + LABEL_LOG_SUFFIX))
+    hit = _label_store_cache.get(json_path)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    store = load_label_store(json_path)
+    _label_store_cache[json_path] = (stamp, store)
+    return store
 
 
 def save_label_store(json_path: str, store: dict) -> bool:
-    """Atomically persist the label store. Returns True on success."""
+    """Atomically persist the label store. Returns True on success.
+
+    The op log is left in place and still replays on top of the saved store;
+    compact_label_store is what folds it in and removes it.
+    """
     try:
         store["updated_at"] = datetime.now(_UTC).isoformat()
         tmp = json_path + ".tmp"
@@ -167,13 +397,8 @@ def get_json_entry(json_path: str, row_idx: int) -> dict:
 
 
 def upsert_json_entry(json_path: str, row_idx: int, updater: Dict[str, object]) -> None:
-    store = load_label_store(json_path)
-    key = str(row_idx)
-    entry = store["labels"].get(key) or {}
-    for k, v in updater.items():
-        entry[k] = v
-    store["labels"][key] = entry
-    save_label_store(json_path, store)
+    # Logged like the window's edits, so it stays ordered with them and survives compaction
+    append_label_ops(json_path, [("entry", row_idx, dict(updater), {})])
 
 
 def merge_json_into_df(json_path: str, df: pd.DataFrame, label_columns: List[str]) -> None:
@@ -249,6 +474,313 @@ def build_thumb_if_needed(images_base: str, resolved_path: str, target_edge: int
         return resolved_path
 
 
+class TinyLFU:
+    """Approximate access frequencies (4x1024 count-min sketch) for cache admission.
+
+    Counters are halved every `sample_size` recorded accesses so old popularity fades.
+    """
+
+    DEPTH = 4
+    WIDTH = 1024  # power of two: probes are masked, not taken modulo
+
+    def __init__(self, sample_size: int) -> None:
+        self._table = np.zeros((self.DEPTH, self.WIDTH), dtype=np.int32)
+        self._rows = np.arange(self.DEPTH)
+        self.sample_size = max(1, int(sample_size))
+        self._ops = 0
+
+    def _probes(self, key) -> List[int]:
+        h = hash(key)
+        return [hash((seed, h)) & (self.WIDTH - 1) for seed in range(self.DEPTH)]
+
+    def increment(self, key) -> None:
+        self._table[self._rows, self._probes(key)] += 1
+        self._ops += 1
+        if self._ops >= self.sample_size:
+            self._table >>= 1
+            self._ops = 0
+
+    def estimate(self, key) -> int:
+        return int(self._table[self._rows, self._probes(key)].min())
+
+    def clear(self) -> None:
+        self._table.fill(0)
+        self._ops = 0
+
+
+class ImageLRU2:
+    """Bounded pixmap cache: a small LRU window in front of an LRU-2 main area (W-TinyLFU).
+
+    New keys always enter the window, so a forward pass over new rows stays cached.
+    A key pushed out of the window joins the main area only if TinyLFU has seen it
+    at least as often as the main victim. In the main area each key remembers its
+    last two access times; the entry whose second-most-recent access is oldest goes
+    first (keys seen only once before any repeat), so one pass over many rows does
+    not flush images viewed repeatedly.
+    """
+
+    WINDOW_SHARE = 4  # the window holds 1/WINDOW_SHARE of maxsize (at least one entry)
+
+    def __init__(self, maxsize: int) -> None:
+        self._window: "OrderedDict[object, QtGui.QPixmap]" = OrderedDict()
+        self._data: "OrderedDict[object, QtGui.QPixmap]" = OrderedDict()
+        self._hits: Dict[object, deque] = {}
+        self._freq = TinyLFU(1)
+        self.maxsize = maxsize
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        self._maxsize = max(1, int(value))
+        self._window_size = max(1, self._maxsize // self.WINDOW_SHARE)
+        self._main_size = self._maxsize - self._window_size
+        self._freq.sample_size = self._maxsize * 10
+        while len(self._window) > self._window_size:
+            self._admit(*self._window.popitem(last=False))
+        while len(self._data) > self._main_size:
+            self._evict()
+
+    def __len__(self) -> int:
+        return len(self._window) + len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._window or key in self._data
+
+    def keys(self) -> List[object]:
+        return list(self._window) + list(self._data)
+
+    def peek(self, key) -> Optional[QtGui.QPixmap]:
+        """Cached value without recording an access (no frequency or recency update)."""
+        value = self._window.get(key)
+        return value if value is not None else self._data.get(key)
+
+    def _touch(self, key) -> None:
+        if key in self._window:
+            self._window.move_to_end(key)
+        else:
+            self._data.move_to_end(key)
+        self._hits.setdefault(key, deque(maxlen=2)).append(time.monotonic())
+
+    def get(self, key) -> Optional[QtGui.QPixmap]:
+        # Misses count too: the caller loads the image and offers it via put()
+        self._freq.increment(key)
+        value = self.peek(key)
+        if value is not None:
+            self._touch(key)
+        return value
+
+    def put(self, key, value: QtGui.QPixmap) -> None:
+        """Store value; a new key goes into the window, pushing its oldest entry to admission."""
+        if key in self._data:
+            self._data[key] = value
+        else:
+            self._window[key] = value
+        self._touch(key)
+        while len(self._window) > self._window_size:
+            self._admit(*self._window.popitem(last=False))
+
+    def _admit(self, key, value: QtGui.QPixmap) -> None:
+        if len(self._data) >= self._main_size:
+            if not self._data:
+                del self._hits[key]  # no main area (maxsize below 2)
+                return
+            victim = self._victim()
+            if self._freq.estimate(key) < self._freq.estimate(victim):
+                del self._hits[key]
+                return
+            self._remove(victim)
+        self._data[key] = value
+
+    def _victim(self):
+        # Backward 2-distance; single-access keys count as infinitely old.
+        # min() keeps the first of equals, i.e. the least recently used.
+        return min(self._data, key=lambda k: self._hits[k][0] if len(self._hits[k]) == 2 else float("-inf"))
+
+    def _remove(self, key) -> None:
+        del self._data[key]
+        del self._hits[key]
+
+    def _evict(self) -> None:
+        self._remove(self._victim())
+
+    def clear(self) -> None:
+        self._window.clear()
+        self._data.clear()
+        self._hits.clear()
+        self._freq.clear()
+
+
+class BasenameIndex:
+    """File-name lookup for one image tree, built by a single os.walk (keys are lowercased).
+
+    Mirrors the recursive glob fallbacks: "**/<name>", "**/<stem>.*" and "**/*<stem>*.*".
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self.ready = False
+        self._by_name: Dict[str, str] = {}
+        self._by_stem: Dict[str, str] = {}
+        self._names: List[Tuple[str, str]] = []
+
+    def build(self) -> None:
+        by_name: Dict[str, str] = {}
+        by_stem: Dict[str, str] = {}
+        names: List[Tuple[str, str]] = []
+        try:
+            for dirpath, _dirs, files in os.walk(self.root):
+                for fn in files:
+                    full = os.path.join(dirpath, fn)
+                    low = fn.lower()
+                    names.append((low, full))
+                    by_name.setdefault(low, full)
+                    # "<stem>.*" matches at every dot, e.g. a.b.png for both "a" and "a.b"
+                    dot = low.find(".", 1)
+                    while dot > 0:
+                        by_stem.setdefault(low[:dot], full)
+                        dot = low.find(".", dot + 1)
+        except Exception:
+            return
+        self._by_name, self._by_stem, self._names = by_name, by_stem, names
+        self.ready = True
+
+    def find(self, basename: str, fuzzy: bool = False) -> Optional[str]:
+        low = basename.lower()
+        stem, _ = os.path.splitext(low)
+        hit = self._by_name.get(low) or (self._by_stem.get(stem) if stem else None)
+        if hit is None and fuzzy and stem:
+            for name, full in self._names:
+                i = name.find(stem)
+                if i >= 0 and "." in name[i + len(stem):]:
+                    return full
+        return hit
+
+
+class FilteredRowsModel(QtCore.QAbstractTableModel):
+    """Read-only preview of the filtered DataFrame rows.
+
+    Column values are held as NumPy arrays taken at the filtered row positions only
+    (indexed by model row); cell text is only formatted for rows Qt actually paints.
+    """
+
+    HEADERS = ["idx", "label", "path", "INF", "EXT"]
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        empty = np.empty(0, dtype=object)
+        self._index = empty
+        self._disp = empty
+        self._active = empty
+        self._inf = empty
+        self._ext = empty
+        self._positions = np.empty(0, dtype=np.intp)
+        self._row_of_pos: Dict[int, int] = {}
+
+    @staticmethod
+    def _column(df: pd.DataFrame, name: str, positions: np.ndarray) -> np.ndarray:
+        if name in df.columns:
+            return df[name].iloc[positions].to_numpy(dtype=object, copy=True)
+        return np.full(len(positions), "", dtype=object)
+
+    @staticmethod
+    def _text(value) -> str:
+        return "" if value is None or pd.isna(value) else str(value)
+
+    def set_frame(self, df: pd.DataFrame, active_label_col: str, positions: np.ndarray) -> None:
+        self.beginResetModel()
+        positions = np.asarray(positions, dtype=np.intp)
+        self._index = df.index.take(positions).to_numpy()
+        if "img_path" in df.columns:
+            self._disp = self._column(df, "img_path", positions)
+        elif "filename" in df.columns:
+            self._disp = self._column(df, "filename", positions)
+        else:
+            self._disp = self._index
+        self._active = self._column(df, active_label_col, positions)
+        self._inf = self._column(df, "review_label_inf", positions)
+        self._ext = self._column(df, "review_label_ext", positions)
+        self._positions = positions
+        self._row_of_pos = {int(pos): row for row, pos in enumerate(positions.tolist())}
+        self.endResetModel()
+
+    def update_position(self, df: pd.DataFrame, pos: int, active_label_col: str) -> None:
+        """Re-read the label columns of one frame row after it was edited."""
+        row = self.row_of_position(pos)
+        if row < 0:
+            return
+        for arr, name in ((self._active, active_label_col), (self._inf, "review_label_inf"), (self._ext, "review_label_ext")):
+            if name in df.columns:
+                arr[row] = df[name].iat[pos]
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def position_at(self, row: int) -> int:
+        return int(self._positions[row])
+
+    def index_at(self, row: int):
+        return self._index[row]
+
+    def row_of_position(self, pos: int) -> int:
+        return self._row_of_pos.get(pos, -1)
+
+    def _cell(self, row: int, column: int) -> str:
+        if column == 0:
+            return str(self._index[row])
+        if column == 1:
+            return "1" if self._text(self._active[row]) else "0"  # for sorting
+        if column == 2:
+            return self._text(self._disp[row])
+        if column == 3:
+            return self._text(self._inf[row])
+        return self._text(self._ext[row])
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._positions)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
+            return None
+        return self._cell(index.row(), index.column())
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def sort(self, column: int, order: QtCore.Qt.SortOrder = QtCore.Qt.AscendingOrder) -> None:
+        if not (0 <= column < len(self.HEADERS)) or len(self._positions) == 0:
+            return
+        if column == 0:
+            keys = list(self._index)  # idx sorts numerically
+        else:
+            keys = [self._cell(row, column) for row in range(len(self._positions))]
+        new_order = np.array(
+            sorted(range(len(keys)), key=keys.__getitem__, reverse=(order == QtCore.Qt.DescendingOrder)),
+            dtype=np.intp,
+        )
+        self.layoutAboutToBeChanged.emit()
+        # Keep selection/current index attached to the same frame rows
+        new_row_of_old = np.empty_like(new_order)
+        new_row_of_old[new_order] = np.arange(len(new_order))
+        old_list = self.persistentIndexList()
+        new_list = [self.index(int(new_row_of_old[i.row()]), i.column()) for i in old_list]
+        self._positions = self._positions[new_order]
+        shares_index = self._disp is self._index
+        self._index = self._index[new_order]
+        self._disp = self._index if shares_index else self._disp[new_order]
+        self._active = self._active[new_order]
+        self._inf = self._inf[new_order]
+        self._ext = self._ext[new_order]
+        self._row_of_pos = {pos: row for row, pos in enumerate(self._positions.tolist())}
+        self.changePersistentIndexList(old_list, new_list)
+        self.layoutChanged.emit()
+
+
 class LabelerWindow(QtWidgets.QMainWindow):
     def __init__(self) -> None:
         super().__init__()
@@ -259,6 +791,8 @@ class LabelerWindow(QtWidgets.QMainWindow):
         self.images_base: str = ""  # inference/viz base
         self.images_base_orig: str = ""  # original images base with same sub-structure
         self.images_base_extra: str = ""  # optional extra images base
+        # root -> basename index of that tree, built in the background on first use
+        self._image_indexes: Dict[str, BasenameIndex] = {}
         self.excel_path: str = ""
         self.output_excel_path: str = ""
         self.json_path: str = ""
@@ -273,8 +807,27 @@ class LabelerWindow(QtWidgets.QMainWindow):
         self.chunk_size = 500  # Reduced from 1000 for smaller chunks
         self.max_table_rows = 2000  # Reduced from 5000 for better performance
         self.image_cache_size = 5  # Reduced from 10 for less memory usage
-        self._image_cache: Dict[str, QtGui.QPixmap] = {}
+        # (path, width, height) -> pixmap decoded at that size; (-1, -1) means full resolution
+        self._image_cache = ImageLRU2(self.image_cache_size)
         self._lazy_loading = True  # Enable lazy loading for large datasets
+        # Per-frame caches, rebuilt lazily after self.df is replaced
+        self._pred_parsed: Optional[List[List[str]]] = None
+        # Summary panel: (data epoch, active column) it was rendered for, cached origin_class counts
+        self._summary_key: Optional[Tuple[int, str]] = None
+        self._origin_counts: Optional[pd.Series] = None
+        # (column, empty/NaN mask) for the active label column
+        self._active_label_empty: Optional[Tuple[str, np.ndarray]] = None
+        # Boolean row mask of the last apply_filters run over self.df
+        self._filter_mask: Optional[np.ndarray] = None
+        self._pred_index: Optional[Dict[str, np.ndarray]] = None
+        self._pred_counts: Optional[np.ndarray] = None
+        self._search_blob: Optional[np.ndarray] = None
+        # Inputs of the last apply_filters run; _data_epoch bumps whenever rows/labels change
+        self._filter_sig: Optional[tuple] = None
+        self._data_epoch: int = 0
+        # Bookmarked row ids and the cached store they were derived from
+        self._bookmark_ids: Optional[np.ndarray] = None
+        self._bookmarked_src: Optional[dict] = None
         
         # Default labeling columns split by mode (INF/EXT)
         self.label_map: Dict[str, List[str]] = {
@@ -290,8 +843,12 @@ class LabelerWindow(QtWidgets.QMainWindow):
             "review_label_ext": ["OK_V3","OK_V4", "NG", "NG_BUT", "보류","매칭","매칭_안됨"],
         }
         self.active_label_col: str = "review_label_inf"
+        # Pooled label choice buttons, reused across refresh_label_controls calls
+        self._choice_btn_pool: List[QtWidgets.QPushButton] = []
         self.current_idx: int = 0
         self.filtered_indices: List[int] = []
+        # df index -> position in filtered_indices
+        self._filtered_index_to_pos: Dict[int, int] = {}
         self.fit_to_window: bool = True
         # Dynamic TO-BE choices extracted from CSV predictions
         self.tobe_choices: List[str] = []
@@ -299,13 +856,38 @@ class LabelerWindow(QtWidgets.QMainWindow):
         self.settings = QtCore.QSettings("rtm", "pyside_labeler")
         # Internal navigation guard
         self._navigating: bool = False
+        # Set while the preview selection is changed programmatically
+        self._syncing_table: bool = False
         # Batched JSON save
         self._pending_ops: List[Tuple[str, int, Dict[str, object], Dict[str, str]]] = []
         self._pending_json_path: str = ""
+        # Store path -> ops in its label log since the last compaction (seeded from the log on first use)
+        self._logged_ops: Dict[str, int] = {}
         self._save_timer = QtCore.QTimer(self)
         self._save_timer.setSingleShot(True)
         self._save_timer.setInterval(150)  # ms
         self._save_timer.timeout.connect(self._flush_pending_ops)
+        # Debounced filtering for live filter inputs (text typing, combo changes)
+        self._filter_debounce = QtCore.QTimer(self)
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(150)  # ms
+        self._filter_debounce.timeout.connect(self._apply_filters_if_changed)
+        # Memory pressure is checked once the user has been idle for a while after
+        # activity (refresh_view/apply_filters restart it), never on a fixed clock
+        self._memory_idle = QtCore.QTimer(self)
+        self._memory_idle.setSingleShot(True)
+        self._memory_idle.setInterval(2000)  # ms
+        self._memory_idle.timeout.connect(self._proactive_memory_cleanup)
+        self._mem_cleanup_floor: float = 0.0  # usage at the last cleanup pass
+        self._mem_log_t: Optional[float] = None
+        # Resizes only rescale the cached pixmaps; images are decoded at the new
+        # viewport size once resizing has stopped
+        self._resize_refresh = QtCore.QTimer(self)
+        self._resize_refresh.setSingleShot(True)
+        self._resize_refresh.setInterval(150)  # ms
+        self._resize_refresh.timeout.connect(self.refresh_view)
+        # viewport -> (label, image path) last shown there, for rescaling during a resize
+        self._shown_images: Dict[QtCore.QObject, Tuple[QtWidgets.QLabel, Optional[str]]] = {}
 
         # UI
         self._build_ui()
@@ -420,7 +1002,7 @@ class LabelerWindow(QtWidgets.QMainWindow):
         images_split.addWidget(infer_panel)
         images_split.addWidget(orig_panel)
         images_split.addWidget(extra_panel)
-        images_split.splitterMoved.connect(lambda *_: self.refresh_view())
+        images_split.splitterMoved.connect(lambda *_: self._resize_refresh.start())
 
         # Right: controls
         right = QtWidgets.QWidget()
@@ -503,6 +1085,10 @@ class LabelerWindow(QtWidgets.QMainWindow):
         self.btn_reset_filter = QtWidgets.QPushButton("Reset")
         self.btn_apply_filter.clicked.connect(self.apply_filters)
         self.btn_reset_filter.clicked.connect(self.reset_filters)
+        # Live inputs go through the debounce timer so only the last change runs the filter
+        self.edt_text.textChanged.connect(lambda *_: self._filter_debounce.start())
+        for cmb in (self.cmb_origin, self.cmb_label_state, self.cmb_label_value, self.cmb_sort_col):
+            cmb.currentIndexChanged.connect(lambda *_: self._filter_debounce.start())
         fl.addWidget(QtWidgets.QLabel("origin_class"), 0, 0)
         fl.addWidget(self.cmb_origin, 0, 1)
         fl.addWidget(QtWidgets.QLabel("Text contains"), 1, 0)
@@ -524,13 +1110,15 @@ class LabelerWindow(QtWidgets.QMainWindow):
         right_layout.addWidget(grp_filter)
 
         # Preview table of filtered items (sortable columns)
-        self.table_preview = QtWidgets.QTableWidget()
-        self.table_preview.setColumnCount(5)
-        self.table_preview.setHorizontalHeaderLabels(["idx", "label", "path", "INF", "EXT"]) 
+        self.table_preview = QtWidgets.QTableView()
+        self.table_model = FilteredRowsModel(self.table_preview)
+        self.table_preview.setModel(self.table_model)
         self.table_preview.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table_preview.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        # Start unsorted (filter order) until the user clicks a header
+        self.table_preview.horizontalHeader().setSortIndicator(-1, QtCore.Qt.AscendingOrder)
         self.table_preview.setSortingEnabled(True)
-        self.table_preview.itemSelectionChanged.connect(self.on_table_select)
+        self.table_preview.selectionModel().selectionChanged.connect(lambda *_: self.on_table_select())
         self.table_preview.horizontalHeader().setStretchLastSection(True)
         right_layout.addWidget(self.table_preview)
 
@@ -625,7 +1213,10 @@ class LabelerWindow(QtWidgets.QMainWindow):
 
     def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
         if event.type() == QtCore.QEvent.Resize and getattr(self, 'fit_to_window', True):
-            self.refresh_view()
+            shown = self._shown_images.get(obj)
+            if shown is not None:
+                self._show_rescaled(shown[0], shown[1], event.size())
+            self._resize_refresh.start()
         return super().eventFilter(obj, event)
 
     def on_fit_toggle(self) -> None:
@@ -640,8 +1231,11 @@ class LabelerWindow(QtWidgets.QMainWindow):
                 return
             uniq: List[str] = []
             seen = set()
-            for v in self.df["pred_seg_results"].fillna(""):
-                for item in parse_pred_list(v):
+            parsed = self._ensure_pred_parsed()
+            # Distinct values in order of first appearance; missing values (code -1) parse to nothing
+            codes = as_categorical(self.df["pred_seg_results"]).cat.codes.to_numpy()
+            for code in pd.unique(codes[codes >= 0]):
+                for item in parsed[code]:
                     s = str(item).strip()
                     if not s:
                         continue
@@ -658,6 +1252,7 @@ class LabelerWindow(QtWidgets.QMainWindow):
         try:
             # Clear existing data and force garbage collection
             self.df = None
+            self._invalidate_frame_caches()
             self._image_cache.clear()
             force_garbage_collection()
             
@@ -740,6 +1335,12 @@ class LabelerWindow(QtWidgets.QMainWindow):
                     if col not in self.df.columns:
                         self.df[col] = ""
                     ensure_object_dtype(self.df, col)
+                for col in CATEGORY_COLUMNS:
+                    if col in self.df.columns:
+                        ensure_category_dtype(self.df, col)
+                for col in TEXT_COLUMNS:
+                    if col in self.df.columns:
+                        ensure_text_dtype(self.df, col)
                 # Merge previous JSON labels into DataFrame (resume work)
                 try:
                     merge_json_into_df(self.json_path, self.df, list(self.label_map.keys()))
@@ -750,7 +1351,7 @@ class LabelerWindow(QtWidgets.QMainWindow):
                     self.compute_tobe_choices()
                 except Exception:
                     pass
-            self.filtered_indices = list(self.df.index) if self.df is not None else []
+            self._set_filtered_indices(list(self.df.index) if self.df is not None else [])
             self.current_idx = 0
             # Build label controls and filter controls
             self.refresh_label_controls()
@@ -798,6 +1399,7 @@ class LabelerWindow(QtWidgets.QMainWindow):
         path = QtWidgets.QFileDialog.getExistingDirectory(self, "Select Original Images Base", os.getcwd())
         if path:
             self.images_base_orig = path
+            self._reset_image_index(path)
             self.refresh_view()
             self.log(f"Set Original Images Base: {path}")
             self.settings.setValue("images_base_orig", path)
@@ -806,6 +1408,7 @@ class LabelerWindow(QtWidgets.QMainWindow):
         path = QtWidgets.QFileDialog.getExistingDirectory(self, "Select Extra Images Base", os.getcwd())
         if path:
             self.images_base_extra = path
+            self._reset_image_index(path)
             self.refresh_view()
             self.log(f"Set Extra Images Base: {path}")
             self.settings.setValue("images_base_extra", path)
@@ -902,27 +1505,18 @@ class LabelerWindow(QtWidgets.QMainWindow):
         sample = indices[:n]
         ok_count = 0
         misses: List[str] = []
-        for ridx in sample:
-            r = self.df.loc[ridx]
-            p = str(r.get("img_path", "")) or str(r.get("filename", ""))
+        # Column views + positions up front instead of a df.loc Series per sampled row
+        no_col = np.full(len(self.df), "", dtype=object)
+        img_arr = self.df["img_path"].to_numpy(dtype=object) if "img_path" in self.df.columns else no_col
+        fn_arr = self.df["filename"].to_numpy(dtype=object) if "filename" in self.df.columns else no_col
+        for pos in self.df.index.get_indexer(sample):
+            p = str(img_arr[pos]) or str(fn_arr[pos])
             if testing_ext:
                 # Use same strategy as extra/original resolution: join rel; else search by filename patterns
                 rel = normalize_relative_path(p)
                 rp = os.path.join(base_dir, rel)
                 if not os.path.exists(rp):
-                    basename = os.path.basename(rel)
-                    base_no_ext, _ = os.path.splitext(basename)
-                    patterns = [
-                        os.path.join(base_dir, "**", basename),
-                        os.path.join(base_dir, "**", f"{base_no_ext}.*"),
-                        os.path.join(base_dir, "**", f"*{base_no_ext}*.*"),
-                    ]
-                    rp = None
-                    for pat in patterns:
-                        m = glob.glob(pat, recursive=True)
-                        if m:
-                            rp = m[0]
-                            break
+                    rp = self._find_in_tree(base_dir, os.path.basename(rel), fuzzy=True)
             else:
                 rp = resolve_image_path(base_dir, p)
             if rp and os.path.exists(rp):
@@ -968,6 +1562,16 @@ class LabelerWindow(QtWidgets.QMainWindow):
             # Apply JSON into the new file
             applied = apply_json_to_excel(self.json_path or default_json_path(out), out, self.sheet_name, col_indices, self.df)
             self.output_excel_path = out
+            # apply_json_to_excel also wrote the values into self.df: rebuild the derived
+            # caches and views, staying on the row that was shown
+            shown = self.filtered_indices[self.current_idx] if 0 <= self.current_idx < len(self.filtered_indices) else None
+            self._invalidate_frame_caches()
+            self.apply_filters()
+            pos = self._filtered_index_to_pos.get(shown, -1)
+            if pos > 0:
+                self.current_idx = pos
+                self._set_table_selection(self._find_list_row_by_index(shown))
+                self.refresh_view()
             self.status.showMessage(f"Applied {applied} cells → {out}")
             self.log(f"Applied JSON to Excel: {applied} cells → {out}")
         except Exception as e:
@@ -1005,7 +1609,7 @@ class LabelerWindow(QtWidgets.QMainWindow):
             pass
         # Queue JSON save (batched)
         row = self.df.loc[row_idx]
-        keys_for_row = {"img_path": str(row.get("img_path", "")), "filename": str(row.get("filename", ""))}
+        keys_for_row = row_identity_keys(row)
         self._queue_set_values(row_idx, {self.active_label_col: value}, keys_for_row)
         self.status.showMessage(f"Queued save: {self.active_label_col}={value}")
         self.log(f"Label saved: row {row_idx} {self.active_label_col}={value}")
@@ -1026,7 +1630,7 @@ class LabelerWindow(QtWidgets.QMainWindow):
             pass
         # Queue JSON save (batched)
         row = self.df.loc[row_idx]
-        keys_for_row = {"img_path": str(row.get("img_path", "")), "filename": str(row.get("filename", ""))}
+        keys_for_row = row_identity_keys(row)
         self._queue_set_values(row_idx, {self.active_label_col: text}, keys_for_row)
         self.status.showMessage(f"Queued save: {self.active_label_col}={text}")
         self.log(f"Label saved: row {row_idx} {self.active_label_col}={text}")
@@ -1088,7 +1692,7 @@ class LabelerWindow(QtWidgets.QMainWindow):
             self.df.at[row_idx, "review_label_inf"] = final_text
         except Exception:
             pass
-        keys_for_row = {"img_path": str(row.get("img_path", "")), "filename": str(row.get("filename", ""))}
+        keys_for_row = row_identity_keys(row)
         self._queue_set_values(row_idx, {"review_label_inf": final_text}, keys_for_row)
         # Ensure active column and refresh
         self.active_label_col = "review_label_inf"
@@ -1179,47 +1783,72 @@ class LabelerWindow(QtWidgets.QMainWindow):
             self.df.at[row_idx, "review_label_inf"] = final_text
         except Exception:
             pass
-        keys_for_row = {"img_path": str(row.get("img_path", "")), "filename": str(row.get("filename", ""))}
+        keys_for_row = row_identity_keys(row)
         self._queue_set_values(row_idx, {"review_label_inf": final_text}, keys_for_row)
         self.status.showMessage("Applied TO-BE → review_label_inf")
         self.log(f"Apply TO-BE: {final_text}")
         self._after_label_saved(row_idx)
 
+    def _set_filtered_indices(self, indices: List[int]) -> None:
+        self.filtered_indices = indices
+        self._filtered_index_to_pos = {idx: pos for pos, idx in enumerate(indices)}
+
     def _find_list_row_by_index(self, idx: int) -> int:
         try:
-            # lookup first column in table
-            for i in range(self.table_preview.rowCount()):
-                it = self.table_preview.item(i, 0)
-                if it and it.text() == str(idx):
-                    return i
+            return self.table_model.row_of_position(self.df.index.get_loc(idx))
         except Exception:
             pass
         return -1
 
+    def _set_table_selection(self, row: int) -> None:
+        """Select a preview row (or none for -1) without re-entering on_table_select."""
+        self._syncing_table = True
+        try:
+            self.table_preview.clearSelection()
+            if row >= 0:
+                self.table_preview.selectRow(row)
+        finally:
+            self._syncing_table = False
+
     def _select_current_in_list(self) -> None:
         try:
             if self.filtered_indices and 0 <= self.current_idx < len(self.filtered_indices):
-                self.table_preview.blockSignals(True)
-                self.table_preview.clearSelection()
-                self.table_preview.selectRow(self.current_idx)
-                self.table_preview.blockSignals(False)
+                self._set_table_selection(self.current_idx)
         except Exception:
             pass
 
-    def _update_stats_quick(self) -> None:
+    def _active_unlabeled_mask(self) -> Optional[np.ndarray]:
+        """Empty/NaN mask of the active label column, cached per column and patched on writes.
+
+        Shared between callers; do not modify in place.
+        """
+        if self.df is None or self.active_label_col not in self.df.columns:
+            return None
+        if self._active_label_empty is None or self._active_label_empty[0] != self.active_label_col:
+            active = self.df[self.active_label_col]
+            self._active_label_empty = (self.active_label_col, (active.isna() | (active == "")).to_numpy())
+        return self._active_label_empty[1]
+
+    def _update_stats_quick(self, unlabeled: Optional[np.ndarray] = None) -> None:
         try:
             total = len(self.df) if self.df is not None else 0
+            if unlabeled is None:
+                unlabeled = self._active_unlabeled_mask()
             overall_unlabeled = 0
             overall_labeled = 0
-            if self.df is not None and self.active_label_col in self.df.columns:
-                overall_unlabeled = int(((self.df[self.active_label_col].isna()) | (self.df[self.active_label_col] == "")).sum())
+            if unlabeled is not None:
+                overall_unlabeled = int(np.count_nonzero(unlabeled))
                 overall_labeled = total - overall_unlabeled
             f_total = len(self.filtered_indices)
             f_labeled = 0
             f_unlabeled = 0
-            if f_total > 0 and self.active_label_col in self.df.columns:
-                sub = self.df.loc[self.filtered_indices, self.active_label_col]
-                f_unlabeled = int(((sub.isna()) | (sub == "")).sum())
+            if f_total > 0 and unlabeled is not None:
+                # Filtered rows come from the last filter mask; positions only if it is stale
+                mask = self._filter_mask
+                if mask is not None and len(mask) == len(unlabeled):
+                    f_unlabeled = int(np.count_nonzero(unlabeled & mask))
+                else:
+                    f_unlabeled = int(np.count_nonzero(unlabeled[self.df.index.get_indexer(self.filtered_indices)]))
                 f_labeled = f_total - f_unlabeled
             self.lbl_stats.setText(
                 f"Filtered: {f_total} | Labeled: {f_labeled} | Unlabeled: {f_unlabeled}  ||  Overall: {total} (L:{overall_labeled} U:{overall_unlabeled})"
@@ -1231,25 +1860,13 @@ class LabelerWindow(QtWidgets.QMainWindow):
         # Update current list item or remove it if filtered out
         state = self.cmb_label_state.currentText()
         unlabeled_only = (state == "Unlabeled") or self.chk_unlabeled.isChecked()
-        label_val = str(self.df.loc[row_idx].get(self.active_label_col, "")) if (self.df is not None and self.active_label_col in self.df.columns) else ""
         removed = False
         self._navigating = True
-        # Update list item text/icon
-        li = self._find_list_row_by_index(row_idx)
-        if 0 <= li:
-            # Always keep the row visible; just update columns
-            self.table_preview.setItem(li, 1, QtWidgets.QTableWidgetItem("1" if label_val else "0"))
-            # Refresh INF/EXT columns from DF so active label goes to correct column
-            try:
-                inf_val = str(self.df.loc[row_idx].get("review_label_inf", "")) if "review_label_inf" in self.df.columns else ""
-            except Exception:
-                inf_val = ""
-            try:
-                ext_val = str(self.df.loc[row_idx].get("review_label_ext", "")) if "review_label_ext" in self.df.columns else ""
-            except Exception:
-                ext_val = ""
-            self.table_preview.setItem(li, 3, QtWidgets.QTableWidgetItem(inf_val))
-            self.table_preview.setItem(li, 4, QtWidgets.QTableWidgetItem(ext_val))
+        # Always keep the row visible; refresh its label/INF/EXT columns from DF
+        try:
+            self.table_model.update_position(self.df, self.df.index.get_loc(row_idx), self.active_label_col)
+        except Exception:
+            pass
         # Force auto-advance to the immediate next row within current filtered order
         if self.current_idx < len(self.filtered_indices) - 1:
             self.current_idx += 1
@@ -1305,17 +1922,21 @@ class LabelerWindow(QtWidgets.QMainWindow):
         idx = list(self.label_map.keys()).index(self.active_label_col) if self.active_label_col in self.label_map else 0
         self.cmb_label_col.setCurrentIndex(idx)
         self.cmb_label_col.blockSignals(False)
-        # Rebuild choice buttons (1..n shortcuts)
-        while self.choice_buttons_layout.count():
-            item = self.choice_buttons_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.setParent(None)
+        # Choice buttons (1..n shortcuts) come from a pool that only grows;
+        # button i always assigns option i, so its slot is connected once
         opts = self.label_map.get(self.active_label_col, [])
-        for i, opt in enumerate(opts):
-            btn = QtWidgets.QPushButton(f"{i+1}. {opt}")
+        while len(self._choice_btn_pool) < len(opts):
+            i = len(self._choice_btn_pool)
+            btn = QtWidgets.QPushButton()
             btn.clicked.connect(lambda _, j=i: self.on_assign_index(j))
             self.choice_buttons_layout.addWidget(btn, i // 3, i % 3)
+            self._choice_btn_pool.append(btn)
+        for i, btn in enumerate(self._choice_btn_pool):
+            if i < len(opts):
+                btn.setText(f"{i+1}. {opts[i]}")
+                btn.show()
+            else:
+                btn.hide()
         # Update dropdown options
         self.cmb_choice.blockSignals(True)
         self.cmb_choice.clear()
@@ -1335,7 +1956,11 @@ class LabelerWindow(QtWidgets.QMainWindow):
         if self.df is not None and "origin_class" in self.df.columns:
             try:
                 # Use unique values from the full dataframe, not filtered
-                vals = pd.Series(self.df["origin_class"].astype(str)).dropna().unique().tolist()
+                origin = self.df["origin_class"]
+                if isinstance(origin.dtype, pd.CategoricalDtype):
+                    vals = origin.cat.categories.tolist()
+                else:
+                    vals = pd.Series(origin.astype(str)).dropna().unique().tolist()
                 for v in sorted([str(x) for x in vals]):
                     self.cmb_origin.addItem(v)
             except Exception:
@@ -1350,27 +1975,27 @@ class LabelerWindow(QtWidgets.QMainWindow):
             for col in list(self.df.columns):
                 self.cmb_sort_col.addItem(col)
         self.cmb_sort_col.blockSignals(False)
-        # pred_seg_results unique values → checkboxes
-        while self.pred_checks_layout.count():
-            it = self.pred_checks_layout.takeAt(0)
-            w = it.widget()
-            if w:
-                w.setParent(None)
+        # pred_seg_results unique values → checkboxes; existing boxes (and their checked state) are reused
+        uniques: List[str] = []
         if self.df is not None and "pred_seg_results" in self.df.columns:
             try:
-                uniques: List[str] = []
-                for v in self.df["pred_seg_results"].fillna(""):
-                    for item in parse_pred_list(v):
-                        if item and item not in uniques:
-                            uniques.append(item)
-                uniques = sorted(uniques)
-                self.pred_checkboxes: Dict[str, QtWidgets.QCheckBox] = {}
-                for i, val in enumerate(uniques):
-                    cb = QtWidgets.QCheckBox(val)
-                    self.pred_checkboxes[val] = cb
-                    self.pred_checks_layout.addWidget(cb, i // 3, i % 3)
+                uniques = sorted(set().union(*self._ensure_pred_parsed()) - {""})
             except Exception:
-                pass
+                uniques = []
+        old_boxes: Dict[str, QtWidgets.QCheckBox] = getattr(self, 'pred_checkboxes', {})
+        new_boxes: Dict[str, QtWidgets.QCheckBox] = {val: old_boxes.get(val) or QtWidgets.QCheckBox(val) for val in uniques}
+        for val, cb in old_boxes.items():
+            if val not in new_boxes:
+                self.pred_checks_layout.removeWidget(cb)
+                cb.deleteLater()
+        # Re-grid only when the sorted set of values changed
+        if list(new_boxes) != list(old_boxes):
+            for val, cb in new_boxes.items():
+                if val in old_boxes:
+                    self.pred_checks_layout.removeWidget(cb)
+            for i, cb in enumerate(new_boxes.values()):
+                self.pred_checks_layout.addWidget(cb, i // 3, i % 3)
+        self.pred_checkboxes = new_boxes
 
     def _populate_value_filter(self) -> None:
         try:
@@ -1397,78 +2022,60 @@ class LabelerWindow(QtWidgets.QMainWindow):
                 pass
 
     def apply_filters(self) -> None:
+        # A direct call supersedes any pending debounced run
+        self._filter_debounce.stop()
+        self._memory_idle.start()
         if self.df is None:
             return
-        
-        # Proactive memory cleanup before filtering
-        self._proactive_memory_cleanup()
+        self._filter_sig = self._current_filter_sig()
         
         # Check memory before filtering
         if self._manage_memory():
             QtWidgets.QMessageBox.warning(self, "Memory Warning", 
                 "Memory usage is high. Some operations may be slower.")
         
-        # Use copy only if necessary (for large datasets, avoid unnecessary copying)
-        if len(self.df) > 5000:  # Reduced from 10000 to 5000
-            # For large datasets, work with view instead of copy
-            df = self.df
-            use_view = True
-        else:
-            df = self.df.copy()
-            use_view = False
+        # All predicates AND into one boolean mask over self.df; the frame is sliced once at the end
+        df = self.df
+        mask = np.ones(len(df), dtype=bool)
         
         # origin_class filter
         origin_sel = self.cmb_origin.currentText()
         if origin_sel and origin_sel != "(all)" and "origin_class" in df.columns:
-            if use_view:
-                mask = df["origin_class"].astype(str) == origin_sel
-                df = df[mask]
-            else:
-                df = df[df["origin_class"].astype(str) == origin_sel]
+            # Categorical column: compares category codes, no per-row str allocation
+            mask &= (df["origin_class"] == origin_sel).to_numpy()
         
-        # text contains across img_path and pred
+        # text contains across img_path and pred (plain substring over the cached lowercased blob)
         t = self.edt_text.text().strip()
         if t:
             t_low = t.lower()
-            mask = pd.Series(False, index=df.index)
-            for col in ("img_path", "filename", "pred_seg_results"):
-                if col in df.columns:
-                    mask = mask | df[col].astype(str).str.lower().str.contains(t_low, na=False)
-            df = df[mask]
+            self._ensure_search_blob()
+            blob = self._search_blob
+            mask &= np.fromiter((t_low in v for v in blob), dtype=bool, count=len(blob))
         
         # value filter for active label column
         val_sel = self.cmb_label_value.currentText() if hasattr(self, 'cmb_label_value') else "(all)"
         if val_sel and val_sel != "(all)" and self.active_label_col in df.columns:
-            df = df[df[self.active_label_col].astype(str) == val_sel]
+            mask &= (df[self.active_label_col].astype(str) == val_sel).to_numpy()
         
         # bookmark-only filter (JSON-backed)
         if hasattr(self, 'chk_bookmarks') and self.chk_bookmarks.isChecked():
             try:
                 json_path = self.json_path or default_json_path(self.output_excel_path or self.excel_path)
-                store = load_label_store(json_path)
-                labels = store.get("labels", {})
-                bookmarked_ids = set()
-                for k, entry in labels.items():
-                    try:
-                        ridx = int(k)
-                    except Exception:
-                        continue
-                    if bool(entry.get("bookmark", False)) and ridx in df.index:
-                        bookmarked_ids.add(ridx)
-                df = df[df.index.isin(bookmarked_ids)]
+                mask &= np.isin(df.index.to_numpy(), self._bookmarked_ids(json_path))
             except Exception:
                 pass
         
         # label state filter
         state = self.cmb_label_state.currentText()
-        if state == "Unlabeled" and self.active_label_col in df.columns:
-            df = df[(df[self.active_label_col].isna()) | (df[self.active_label_col] == "")]
-        elif state == "Labeled" and self.active_label_col in df.columns:
-            df = df[(~df[self.active_label_col].isna()) & (df[self.active_label_col] != "")]
-        
-        # legacy checkbox support
-        if self.chk_unlabeled.isChecked() and self.active_label_col in df.columns:
-            df = df[(df[self.active_label_col].isna()) | (df[self.active_label_col] == "")]
+        unlabeled = self._active_unlabeled_mask()
+        if unlabeled is not None:
+            if state == "Unlabeled":
+                mask &= unlabeled
+            elif state == "Labeled":
+                mask &= ~unlabeled
+            # legacy checkbox support
+            if self.chk_unlabeled.isChecked():
+                mask &= unlabeled
         
         # pred_seg_results filter logic
         try:
@@ -1477,34 +2084,34 @@ class LabelerWindow(QtWidgets.QMainWindow):
                 for k, cb in self.pred_checkboxes.items():
                     if cb.isChecked():
                         selected.append(k)
-            if selected:
+            if selected and 'pred_seg_results' in df.columns:
                 exclusive = self.chk_pred_exclusive.isChecked() if hasattr(self, 'chk_pred_exclusive') else False
                 exclude = self.chk_pred_exclude.isChecked() if hasattr(self, 'chk_pred_exclude') else False
-                keep_mask = []
-                for ridx, v in df['pred_seg_results'].fillna("").items() if 'pred_seg_results' in df.columns else []:
-                    items = set(parse_pred_list(v))
-                    if exclude:
-                        # drop rows that contain any selected items
-                        keep = len(items.intersection(selected)) == 0
-                    elif exclusive:
-                        # keep only rows whose set equals selected
-                        keep = items and items.issubset(set(selected)) and set(selected).issubset(items)
-                    else:
-                        # keep rows that contain at least one selected item
-                        keep = len(items.intersection(selected)) > 0
-                    keep_mask.append(keep)
-                if 'pred_seg_results' in df.columns:
-                    df = df[pd.Series(keep_mask, index=df.index)]
+                self._ensure_pred_index()
+                none = np.zeros(len(df), dtype=bool)
+                hits = [self._pred_index.get(k, none) for k in selected]
+                if exclude:
+                    # drop rows that contain any selected items
+                    mask &= ~np.logical_or.reduce(hits)
+                elif exclusive:
+                    # keep only rows whose set equals selected
+                    mask &= np.logical_and.reduce(hits) & (self._pred_counts == len(selected))
+                else:
+                    # keep rows that contain at least one selected item
+                    mask &= np.logical_or.reduce(hits)
         except Exception:
             pass
         
-        # sort
+        # sort (only the sort column of the surviving rows is touched)
+        self._filter_mask = mask
+        filtered_positions = np.flatnonzero(mask)
         sort_col = self.cmb_sort_col.currentText()
         if sort_col and sort_col != "(no sort)" and sort_col in df.columns:
-            df = df.sort_values(by=sort_col, ascending=not self.chk_sort_desc.isChecked(), kind="mergesort")
+            order = stable_sort_order(df[sort_col].iloc[filtered_positions], self.chk_sort_desc.isChecked())
+            filtered_positions = filtered_positions[order]
         
         # update indices/preview list
-        self.filtered_indices = list(df.index)
+        self._set_filtered_indices(df.index[filtered_positions].tolist())
         self.current_idx = 0 if self.filtered_indices else 0
         
         # Preserve current sort
@@ -1512,84 +2119,115 @@ class LabelerWindow(QtWidgets.QMainWindow):
         sort_col = header.sortIndicatorSection() if hasattr(header, 'sortIndicatorSection') else -1
         sort_order = header.sortIndicatorOrder() if hasattr(header, 'sortIndicatorOrder') else QtCore.Qt.AscendingOrder
         
-        # Populate preview table with row limit for performance
-        self.table_preview.blockSignals(True)
-        self.table_preview.setSortingEnabled(False)
-        self.table_preview.clearContents()
-        
         # Limit table rows for performance
-        display_indices = self.filtered_indices[:self.max_table_rows]
         if len(self.filtered_indices) > self.max_table_rows:
             self.log(f"Showing first {self.max_table_rows} of {len(self.filtered_indices)} filtered rows")
         
-        self.table_preview.setRowCount(len(display_indices))
-        for r, idx in enumerate(display_indices):
-            row = self.df.loc[idx]
-            disp = str(row.get("img_path", row.get("filename", idx)))
-            # INF/EXT values for list columns
-            inf_val = str(row.get("review_label_inf", "")) if "review_label_inf" in self.df.columns else ""
-            ext_val = str(row.get("review_label_ext", "")) if "review_label_ext" in self.df.columns else ""
-            # Active column value for quick flag
-            active_val = str(row.get(self.active_label_col, "")) if self.active_label_col in self.df.columns else ""
-            label_flag = "1" if active_val else "0"  # for sorting
-            self.table_preview.setItem(r, 0, QtWidgets.QTableWidgetItem(str(idx)))
-            self.table_preview.setItem(r, 1, QtWidgets.QTableWidgetItem(label_flag))
-            self.table_preview.setItem(r, 2, QtWidgets.QTableWidgetItem(disp))
-            self.table_preview.setItem(r, 3, QtWidgets.QTableWidgetItem(inf_val))
-            self.table_preview.setItem(r, 4, QtWidgets.QTableWidgetItem(ext_val))
-        
-        self.table_preview.setSortingEnabled(True)
-        # Re-apply preserved sort if any
-        if sort_col is not None and sort_col >= 0 and self.table_preview.rowCount() > 0:
-            self.table_preview.sortByColumn(sort_col, sort_order)
-        self.table_preview.blockSignals(False)
+        # Swap the model's rows in one reset; cell text is produced lazily for visible rows
+        self._syncing_table = True
+        try:
+            self.table_model.set_frame(self.df, self.active_label_col, filtered_positions[:self.max_table_rows])
+            # Re-apply preserved sort if any
+            if sort_col is not None and sort_col >= 0 and self.table_model.rowCount() > 0:
+                self.table_preview.sortByColumn(sort_col, sort_order)
+        finally:
+            self._syncing_table = False
         
         # default-select the top-most row
-        if self.filtered_indices and self.table_preview.rowCount() > 0:
+        if self.filtered_indices and self.table_model.rowCount() > 0:
             self.current_idx = 0
             self.table_preview.selectRow(0)
         
-        # live stats (filtered + overall)
-        total = len(self.df) if self.df is not None else 0
-        overall_unlabeled = 0
-        overall_labeled = 0
-        if self.df is not None and self.active_label_col in self.df.columns:
-            overall_unlabeled = int(((self.df[self.active_label_col].isna()) | (self.df[self.active_label_col] == "")).sum())
-            overall_labeled = total - overall_unlabeled
-        
-        # filtered counts
-        f_total = len(self.filtered_indices)
-        f_labeled = 0
-        f_unlabeled = 0
-        if f_total > 0 and self.active_label_col in self.df.columns:
-            sub = self.df.loc[self.filtered_indices, self.active_label_col]
-            f_unlabeled = int(((sub.isna()) | (sub == "")).sum())
-            f_labeled = f_total - f_unlabeled
-        
-        self.lbl_stats.setText(
-            f"Filtered: {f_total} | Labeled: {f_labeled} | Unlabeled: {f_unlabeled}  ||  Overall: {total} (L:{overall_labeled} U:{overall_unlabeled})"
-        )
+        # live stats (filtered + overall) from the filter mask and the unlabeled mask above
+        self._update_stats_quick(unlabeled)
         self.refresh_view()
         
         # Ensure current row is selected in the list for visibility
         # ensure selected row in table remains in sync
         try:
             if self.filtered_indices and 0 <= self.current_idx < len(self.filtered_indices):
-                self.table_preview.blockSignals(True)
-                self.table_preview.clearSelection()
                 sel_idx = self.filtered_indices[self.current_idx]
-                row_in_table = self._find_list_row_by_index(sel_idx)
-                if row_in_table >= 0:
-                    self.table_preview.selectRow(row_in_table)
-                self.table_preview.blockSignals(False)
+                self._set_table_selection(self._find_list_row_by_index(sel_idx))
         except Exception:
             pass
         
         # Update summary after any filter change
         self.update_summary()
-        
-        # Final memory check after filtering
-        self._proactive_memory_cleanup()
+
+    def _invalidate_frame_caches(self) -> None:
+        """Drop caches derived from self.df; call whenever the frame is replaced."""
+        self._filter_mask = None
+        self._active_label_empty = None
+        self._origin_counts = None
+        self._pred_parsed = None
+        self._pred_index = None
+        self._pred_counts = None
+        self._search_blob = None
+        self._data_epoch += 1
+
+    def _current_filter_sig(self) -> tuple:
+        """Everything apply_filters reads from the UI and data, as a hashable tuple."""
+        return (
+            self._data_epoch,
+            self.active_label_col,
+            self.max_table_rows,
+            self.cmb_origin.currentText(),
+            self.edt_text.text().strip(),
+            self.cmb_label_value.currentText(),
+            self.cmb_label_state.currentText(),
+            self.chk_unlabeled.isChecked(),
+            self.chk_bookmarks.isChecked(),
+            tuple(k for k, cb in self.pred_checkboxes.items() if cb.isChecked()) if hasattr(self, 'pred_checkboxes') else (),
+            self.chk_pred_exclusive.isChecked(),
+            self.chk_pred_exclude.isChecked(),
+            self.cmb_sort_col.currentText(),
+            self.chk_sort_desc.isChecked(),
+        )
+
+    def _apply_filters_if_changed(self) -> None:
+        """Debounce target: skip the run when the settled inputs match the last one."""
+        if self.df is not None and self._filter_sig == self._current_filter_sig():
+            return
+        self.apply_filters()
+
+    def _bookmarked_ids(self, json_path: str) -> np.ndarray:
+        """Sorted row indices bookmarked in the JSON store, rebuilt only when the store changes."""
+        store = load_label_store_cached(json_path)
+        if self._bookmark_ids is None or self._bookmarked_src is not store:
+            keys = [k for k, entry in store.get("labels", {}).items() if bool(entry.get("bookmark", False))]
+            ids = pd.to_numeric(pd.Series(keys, dtype=object), errors="coerce").dropna()
+            self._bookmark_ids = np.unique(ids.to_numpy(dtype=np.int64))
+            self._bookmarked_src = store
+        return self._bookmark_ids
+
+    def _ensure_pred_parsed(self) -> List[List[str]]:
+        """Parsed pred_seg_results per category, computed once per frame."""
+        if self._pred_parsed is None:
+            if self.df is None or "pred_seg_results" not in self.df.columns:
+                return []
+            cats = as_categorical(self.df["pred_seg_results"]).cat.categories
+            self._pred_parsed = [parse_pred_list(v) for v in cats]
+        return self._pred_parsed
+
+    def _ensure_pred_index(self) -> None:
+        """Build the pred_seg_results inverted index on first use after a data change."""
+        if self._pred_index is None and self.df is not None and "pred_seg_results" in self.df.columns:
+            self._pred_index, self._pred_counts = build_pred_index(self.df["pred_seg_results"], self._ensure_pred_parsed())
+
+    def _ensure_search_blob(self) -> None:
+        """Cache img_path/filename/pred_seg_results per row, lowercased and joined by a unit separator."""
+        if self._search_blob is not None or self.df is None:
+            return
+        parts = [
+            self.df[col].astype(object).fillna("").astype(str)
+            for col in ("img_path", "filename", "pred_seg_results")
+            if col in self.df.columns
+        ]
+        if parts:
+            joined = parts[0].str.cat(parts[1:], sep="\x1f") if len(parts) > 1 else parts[0]
+            self._search_blob = joined.str.lower().to_numpy(dtype=object)
+        else:
+            self._search_blob = np.full(len(self.df), "", dtype=object)
 
     def on_clear_sort(self) -> None:
         try:
@@ -1603,13 +2241,20 @@ class LabelerWindow(QtWidgets.QMainWindow):
 
     def update_summary(self) -> None:
         if self.df is None or self.df.empty:
+            self._summary_key = None
             self.txt_summary.setPlainText("No data loaded.")
             return
+        # Overall distributions ignore the filters; only data/label edits or the active column change them
+        key = (self._data_epoch, self.active_label_col)
+        if key == self._summary_key:
+            return
+        self._summary_key = key
         total = len(self.df)
         labeled = 0
         unlabeled = 0
-        if self.active_label_col in self.df.columns:
-            unlabeled = int(((self.df[self.active_label_col].isna()) | (self.df[self.active_label_col] == "")).sum())
+        empty = self._active_unlabeled_mask()
+        if empty is not None:
+            unlabeled = int(np.count_nonzero(empty))
             labeled = total - unlabeled
         prog_pct = (labeled / total * 100.0) if total else 0.0
         # Label distribution (top 10)
@@ -1625,8 +2270,9 @@ class LabelerWindow(QtWidgets.QMainWindow):
         origin_dist = []
         if "origin_class" in self.df.columns:
             try:
-                vc2 = self.df["origin_class"].astype(str).value_counts()
-                for k, v in vc2.head(10).items():
+                if self._origin_counts is None:
+                    self._origin_counts = self.df["origin_class"].astype(str).value_counts()
+                for k, v in self._origin_counts.head(10).items():
                     origin_dist.append(f"  - {k}: {v}")
             except Exception:
                 pass
@@ -1656,41 +2302,57 @@ class LabelerWindow(QtWidgets.QMainWindow):
         json_path = self.json_path or default_json_path(self.output_excel_path or self.excel_path)
         self._pending_json_path = json_path
         self._pending_ops.append(("meta", row_idx, updater, {}))
+        if "bookmark" in updater:
+            self._bookmark_ids = None
+            self._data_epoch += 1
         self._save_timer.start()
 
     def _queue_set_values(self, row_idx: int, values: Dict[str, str], keys_for_row: Dict[str, str]) -> None:
         json_path = self.json_path or default_json_path(self.output_excel_path or self.excel_path)
         self._pending_json_path = json_path
         self._pending_ops.append(("values", row_idx, values, keys_for_row))
+        self._data_epoch += 1
+        # Patch the cached empty mask for this one row instead of rescanning the column
+        cached = self._active_label_empty
+        if cached is not None and cached[0] in values:
+            try:
+                val = values[cached[0]]
+                cached[1][self.df.index.get_loc(row_idx)] = val is None or pd.isna(val) or val == ""
+            except Exception:
+                self._active_label_empty = None
         self._save_timer.start()
 
     def _flush_pending_ops(self) -> None:
         if not self._pending_ops:
             return
         json_path = self._pending_json_path or (self.json_path or default_json_path(self.output_excel_path or self.excel_path))
-        store = load_label_store(json_path)
-        for kind, row_idx, payload, keys_for_row in self._pending_ops:
-            key = str(row_idx)
-            entry = store["labels"].get(key) or {}
-            # Ensure identity keys present
-            for k, v in keys_for_row.items():
-                entry[k] = v
-            if kind == "values":
-                vals = entry.get("values") or {}
-                for k, v in payload.items():
-                    vals[k] = v
-                entry["values"] = vals
-            else:
-                for k, v in payload.items():
-                    entry[k] = v
-            store["labels"][key] = entry
-        ok = save_label_store(json_path, store)
-        self._pending_ops.clear()
+        # Append-only: the store is only rewritten when the log is compacted
+        if json_path not in self._logged_ops:
+            self._logged_ops[json_path] = count_label_ops(json_path)
+        ok = append_label_ops(json_path, self._pending_ops)
+        if ok:
+            self._logged_ops[json_path] += len(self._pending_ops)
+            self._pending_ops.clear()
+        # On failure the ops stay queued: the next edit or closeEvent retries them
+        # (replaying an op twice is harmless, each one just sets values)
+        if ok and self._logged_ops[json_path] >= LABEL_LOG_COMPACT_OPS:
+            ok = compact_label_store(json_path)
+            self._logged_ops[json_path] = 0
         if ok:
             self.status.showMessage("Saved JSON")
         else:
             self.status.showMessage("Save JSON failed")
 
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        try:
+            self._flush_pending_ops()
+            json_path = self._pending_json_path or self.json_path
+            if json_path and compact_label_store(json_path):
+                self._logged_ops.pop(json_path, None)
+        except Exception:
+            pass
+        super().closeEvent(event)
+
     def reset_filters(self) -> None:
         if self.df is None:
             return
@@ -1712,17 +2374,17 @@ class LabelerWindow(QtWidgets.QMainWindow):
         self.apply_filters()
 
     def on_table_select(self) -> None:
+        if self._syncing_table:
+            return
         rows = self.table_preview.selectionModel().selectedRows()
         if not rows:
             return
         row = rows[0].row()
         try:
-            idx_item = self.table_preview.item(row, 0)
-            if not idx_item:
-                return
-            df_idx = int(idx_item.text())
-            if df_idx in self.filtered_indices:
-                self.current_idx = self.filtered_indices.index(df_idx)
+            df_idx = int(self.table_model.index_at(row))
+            pos = self._filtered_index_to_pos.get(df_idx, -1)
+            if pos >= 0:
+                self.current_idx = pos
                 self.refresh_view()
         except Exception:
             pass
@@ -1748,11 +2410,34 @@ class LabelerWindow(QtWidgets.QMainWindow):
         self.status.showMessage("Memo queued")
         self.log(f"Memo saved for row {row_idx} ({len(memo)} chars)")
 
+    def _reset_image_index(self, root: str) -> BasenameIndex:
+        """(Re)build the basename index of root on the global thread pool."""
+        index = BasenameIndex(root)
+        self._image_indexes[root] = index
+        QtCore.QThreadPool.globalInstance().start(index.build)
+        return index
+
+    def _find_in_tree(self, root: str, basename: str, fuzzy: bool = False) -> Optional[str]:
+        """Find basename anywhere under root: index lookup once built, recursive glob until then."""
+        index = self._image_indexes.get(root) or self._reset_image_index(root)
+        if index.ready:
+            return index.find(basename, fuzzy)
+        base_no_ext, _ = os.path.splitext(basename)
+        patterns = [os.path.join(root, "**", basename), os.path.join(root, "**", f"{base_no_ext}.*")]
+        if fuzzy:
+            patterns.append(os.path.join(root, "**", f"*{base_no_ext}*.*"))
+        for pattern in patterns:
+            m = glob.glob(pattern, recursive=True)
+            if m:
+                return m[0]
+        return None
+
     def _resolve_img_for_row(self, row_idx: int) -> Tuple[Optional[str], Optional[str], Optional[str], str]:
         if self.df is None or self.images_base == "":
             return None, None, None, ""
         r = self.df.loc[row_idx]
-        p = str(r.get("img_path", "")) or str(r.get("filename", ""))
+        keys = row_identity_keys(r)
+        p = keys["img_path"] or keys["filename"]
         resolved_infer = resolve_image_path(self.images_base, p)
         # Resolve original using same relative path or basename match
         resolved_orig = None
@@ -1762,16 +2447,7 @@ class LabelerWindow(QtWidgets.QMainWindow):
             if os.path.exists(cand):
                 resolved_orig = cand
             else:
-                base = os.path.basename(rel)
-                base_no_ext, _ = os.path.splitext(base)
-                for pattern in [
-                    os.path.join(self.images_base_orig, "**", base),
-                    os.path.join(self.images_base_orig, "**", f"{base_no_ext}.*"),
-                ]:
-                    m = glob.glob(pattern, recursive=True)
-                    if m:
-                        resolved_orig = m[0]
-                        break
+                resolved_orig = self._find_in_tree(self.images_base_orig, os.path.basename(rel))
         # Resolve extra similarly
         resolved_extra = None
         if self.images_base_extra:
@@ -1780,20 +2456,11 @@ class LabelerWindow(QtWidgets.QMainWindow):
             if os.path.exists(cand):
                 resolved_extra = cand
             else:
-                base = os.path.basename(rel)
-                base_no_ext, _ = os.path.splitext(base)
-                for pattern in [
-                    os.path.join(self.images_base_extra, "**", base),
-                    os.path.join(self.images_base_extra, "**", f"{base_no_ext}.*"),
-                    os.path.join(self.images_base_extra, "**", f"*{base_no_ext}*.*"),
-                ]:
-                    m = glob.glob(pattern, recursive=True)
-                    if m:
-                        resolved_extra = m[0]
-                        break
+                resolved_extra = self._find_in_tree(self.images_base_extra, os.path.basename(rel), fuzzy=True)
         return resolved_infer, resolved_orig, resolved_extra, p
 
     def refresh_view(self) -> None:
+        self._memory_idle.start()
         if self.df is None or not self.filtered_indices:
             self.image_label_infer.setPixmap(QtGui.QPixmap())
             self.image_label_orig.setPixmap(QtGui.QPixmap())
@@ -1855,15 +2522,36 @@ class LabelerWindow(QtWidgets.QMainWindow):
         except Exception:
             pass
 
+    def _show_rescaled(self, label: QtWidgets.QLabel, path: Optional[str], size: QtCore.QSize) -> None:
+        """Interim image while resizing: the largest cached decode of path, scaled (fast) to size."""
+        if not path or size.width() <= 0 or size.height() <= 0:
+            return
+        best: Optional[QtGui.QPixmap] = None
+        for key in self._image_cache.keys():
+            if key[0] == path:
+                pixmap = self._image_cache.peek(key)
+                if best is None or pixmap.width() * pixmap.height() > best.width() * best.height():
+                    best = pixmap
+        if best is not None:
+            label.setPixmap(best.scaled(size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation))
+
     def _set_image_on_label(self, label: QtWidgets.QLabel, scroll: QtWidgets.QScrollArea, path: Optional[str]) -> None:
+        self._shown_images[scroll.viewport()] = (label, path)
         if not path or not os.path.exists(path):
             label.setPixmap(QtGui.QPixmap())
             return
         
+        # Fit mode decodes straight to the viewport size, so the cache holds display-sized pixmaps
+        target: Optional[QtCore.QSize] = None
+        if getattr(self, 'fit_to_window', True):
+            vp_size = scroll.viewport().size()
+            if vp_size.width() > 0 and vp_size.height() > 0:
+                target = vp_size
+        key = (path, target.width(), target.height()) if target is not None else (path, -1, -1)
+        
         # Check cache first
-        if path in self._image_cache:
-            pixmap = self._image_cache[path]
-        else:
+        pixmap = self._image_cache.get(key)
+        if pixmap is None:
             # Load image with memory management
             try:
                 # Check memory usage before loading
@@ -1871,14 +2559,10 @@ class LabelerWindow(QtWidgets.QMainWindow):
                     # Clear old cache entries if memory is high
                     self._clear_image_cache()
                 
-                pixmap = QtGui.QPixmap(path)
+                pixmap = self._read_pixmap(path, target)
                 if not pixmap.isNull():
-                    # Add to cache (limit cache size)
-                    if len(self._image_cache) >= self.image_cache_size:
-                        # Remove oldest entry
-                        oldest_key = next(iter(self._image_cache))
-                        del self._image_cache[oldest_key]
-                    self._image_cache[path] = pixmap
+                    # Add to cache (TinyLFU admission, LRU-2 eviction once image_cache_size is reached)
+                    self._image_cache.put(key, pixmap)
                 else:
                     label.setPixmap(QtGui.QPixmap())
                     return
@@ -1887,18 +2571,28 @@ class LabelerWindow(QtWidgets.QMainWindow):
                 label.setPixmap(QtGui.QPixmap())
                 return
         
-        if not getattr(self, 'fit_to_window', True):
-            label.setPixmap(pixmap)
-            return
-        
-        vp_size = scroll.viewport().size()
-        if vp_size.width() <= 0 or vp_size.height() <= 0:
-            label.setPixmap(pixmap)
-            return
-        
-        # Scale image to fit viewport
-        scaled = pixmap.scaled(vp_size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-        label.setPixmap(scaled)
+        label.setPixmap(pixmap)
+    
+    @staticmethod
+    def _read_pixmap(path: str, target: Optional[QtCore.QSize] = None) -> QtGui.QPixmap:
+        """Decode an image, letting the codec scale it to fit target (aspect kept) when given."""
+        reader = QtGui.QImageReader(path)
+        reader.setAutoTransform(True)
+        if target is not None:
+            size = reader.size()
+            if size.isValid() and not size.isEmpty():
+                # The scaled size applies before EXIF rotation, so fit the rotated shape
+                rotated = bool(reader.transformation() & QtGui.QImageIOHandler.Transformation.TransformationRotate90)
+                shown = size.transposed() if rotated else size
+                fitted = shown.scaled(target, QtCore.Qt.KeepAspectRatio)
+                reader.setScaledSize(fitted.transposed() if rotated else fitted)
+        image = reader.read()
+        if image.isNull():
+            return QtGui.QPixmap()
+        if target is not None and not reader.scaledSize().isValid():
+            # Size unknown up front: fall back to scaling the decoded image
+            image = image.scaled(target, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        return QtGui.QPixmap.fromImage(image)
     
     def _clear_image_cache(self):
         """Clear image cache to free memory"""
@@ -1917,24 +2611,31 @@ class LabelerWindow(QtWidgets.QMainWindow):
         return False
 
     def _proactive_memory_cleanup(self):
-        """More aggressive memory cleanup"""
-        memory_usage = get_memory_usage()
-        if memory_usage > self.max_memory_mb * 0.7:  # Even earlier intervention
+        """Idle-time memory cleanup; repeats only when usage has grown since the last pass"""
+        memory_usage = get_memory_usage(fresh=True)
+        if memory_usage <= self.max_memory_mb * 0.7:  # Even earlier intervention
+            self._mem_cleanup_floor = 0.0
+            return False
+        # A large DataFrame alone can sit above the threshold: nothing new to reclaim then
+        if memory_usage <= self._mem_cleanup_floor + self.max_memory_mb * 0.02:
+            return False
+        self._mem_cleanup_floor = memory_usage
+        now = time.monotonic()
+        if self._mem_log_t is None or now - self._mem_log_t >= 30.0:
             self.log(f"Proactive memory cleanup: {memory_usage:.1f}MB")
-            # Clear image cache
+            self._mem_log_t = now
+        # Dropping the image cache and a full collection only pay off under real pressure
+        if memory_usage > self.max_memory_mb * 0.9:
             self._image_cache.clear()
-            # Force garbage collection multiple times
-            for _ in range(3):
-                force_garbage_collection()
-            # Clear any temporary variables
-            if hasattr(self, '_temp_data'):
-                del self._temp_data
-            return True
-        return False
+            gc.collect(2)
+        # Clear any temporary variables
+        if hasattr(self, '_temp_data'):
+            del self._temp_data
+        return True
 
     def _show_memory_info(self):
         """Show current memory usage information"""
-        memory_usage = get_memory_usage()
+        memory_usage = get_memory_usage(fresh=True)
         cache_size = len(self._image_cache)
         df_size = len(self.df) if self.df is not None else 0
         
@@ -1979,8 +2680,17 @@ Memory Limit: {self.max_memory_mb}MB"""
                 # Append to existing DataFrame
                 self.df = pd.concat([self.df, chunk_df], ignore_index=True)
             
+            # concat drops Categorical when the chunks' categories differ
+            for col in CATEGORY_COLUMNS:
+                if col in self.df.columns:
+                    ensure_category_dtype(self.df, col)
+            for col in TEXT_COLUMNS:
+                if col in self.df.columns:
+                    ensure_text_dtype(self.df, col)
+            self._invalidate_frame_caches()
+            
             # Update UI
-            self.filtered_indices = list(self.df.index)
+            self._set_filtered_indices(list(self.df.index))
             self.populate_filter_controls()
             self.apply_filters()
             
@@ -2000,13 +2710,12 @@ Memory Limit: {self.max_memory_mb}MB"""
         self.log("Forcing memory cleanup...")
         # Clear image cache
         self._image_cache.clear()
-        # Force garbage collection multiple times
-        for i in range(5):
-            force_garbage_collection()
+        # A single full collection; repeating it finds nothing new
+        force_garbage_collection()
         # Clear any temporary data
         if hasattr(self, '_temp_data'):
             del self._temp_data
-        memory_usage = get_memory_usage()
+        memory_usage = get_memory_usage(fresh=True)
         self.log(f"Memory cleanup completed. Current usage: {memory_usage:.1f}MB")
         QtWidgets.QMessageBox.information(self, "Memory Cleanup", 
             f"Memory cleanup completed.\nCurrent usage: {memory_usage:.1f}MB")
@@ -2024,21 +2733,36 @@ Memory Limit: {self.max_memory_mb}MB"""
         old_limit = self.max_memory_mb
         self.max_memory_mb = optimal_limit
         
-        # Adjust other settings based on available memory
-        if available_memory < 2048:  # Less than 2GB available
-            self.chunk_size = 250
-            self.max_table_rows = 1000
-            self.image_cache_size = 3
-        elif available_memory < 4096:  # Less than 4GB available
-            self.chunk_size = 500
-            self.max_table_rows = 2000
-            self.image_cache_size = 5
-        else:  # 4GB+ available
-            self.chunk_size = 1000
-            self.max_table_rows = 3000
-            self.image_cache_size = 8
+        # Adjust other settings based on available memory:
+        # chunk = clamp(M_avail * M_target / K, 250, 2000), scaled by a pressure factor A
+        target_fraction = 0.3  # M_target: share of available memory for loaded rows
+        mb_per_row = 0.5  # K: rough per-row footprint
+        base_chunk = max(250, min(2000, int(available_memory * target_fraction / mb_per_row)))
+        pressure = 1.0 - available_memory / system_memory if system_memory > 0 else 1.0
+        if pressure > 0.8:
+            factor = 0.8
+        elif pressure > 0.6:
+            factor = 0.9
+        elif pressure < 0.3:
+            factor = 1.1
+        else:
+            factor = 1.0
+        self.chunk_size = int(base_chunk * factor)
+        self.max_table_rows = self.chunk_size * 3
+        self.image_cache_size = max(3, min(16, int(available_memory / 512)))
+        self._image_cache.maxsize = self.image_cache_size
         
-        info = f"""Memory settings optimized:
+        # Report once control is back in the event loop
+        QtCore.QTimer.singleShot(0, lambda: self._show_mem_report(old_limit, system_memory, current_usage, available_memory))
+
+    def _show_mem_report(self, old_limit: float, system_memory: float, current_usage: float, available_memory: float) -> None:
+        self.log("Memory settings optimized")
+        QtWidgets.QMessageBox.information(
+            self, "Memory Settings Optimized", self._format_mem_report(old_limit, system_memory, current_usage, available_memory)
+        )
+
+    def _format_mem_report(self, old_limit: float, system_memory: float, current_usage: float, available_memory: float) -> str:
+        return f"""Memory settings optimized:
 System Memory: {system_memory:.0f}MB
 Current Usage: {current_usage:.1f}MB
 Available Memory: {available_memory:.0f}MB
@@ -2048,9 +2772,6 @@ New Settings:
 - Chunk Size: {self.chunk_size}
 - Max Table Rows: {self.max_table_rows}
 - Image Cache Size: {self.image_cache_size}"""
-        
-        self.log("Memory settings optimized")
-        QtWidgets.QMessageBox.information(self, "Memory Settings Optimized", info)
 
     def _select_all_pred_filters(self):
         for cb in self.pred_checkboxes.values():
@@ -2072,18 +2793,19 @@ def main() -> None:
     app = QtWidgets.QApplication([sys.argv[0], *qt_args])
     w = LabelerWindow()
 
-    # Apply CLI args
+    # Apply CLI args: image bases first, so loading the file renders with them
+    # and the view is refreshed only once
     try:
+        dirty = False
+        for attr, val in (("images_base", args.images),
+                          ("images_base_orig", args.orig_images),
+                          ("images_base_extra", args.extra_images)):
+            if val and os.path.isdir(val):
+                setattr(w, attr, val)
+                dirty = True
         if args.file and os.path.exists(args.file):
-            w.load_excel_from_path(args.file)
-        if args.images and os.path.isdir(args.images):
-            w.images_base = args.images
-        if args.orig_images and os.path.isdir(args.orig_images):
-            w.images_base_orig = args.orig_images
-        if args.extra_images and os.path.isdir(args.extra_images):
-            w.images_base_extra = args.extra_images
-        # Refresh view if any base set
-        if args.images or args.orig_images or args.extra_images:
+            w.load_excel_from_path(args.file)  # refreshes the view itself
+        elif dirty:
             w.refresh_view()
     except Exception:
         pass
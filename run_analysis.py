@@ -7,8 +7,10 @@ Image Analysis Excel Generator - 통합 실행 파일
 
 import sys
 import os
+import argparse
 import locale
 import subprocess
+from importlib.metadata import PackageNotFoundError, distribution
 
 # 한글 자소 분리 문제 해결을 위한 인코딩 설정
 if sys.platform.startswith('darwin'):  # macOS
@@ -22,6 +24,21 @@ except:
     except:
         pass
 
+# 메뉴 번호 -> (스크립트, 설명, 메뉴 제목, 메뉴 상세, 실행 전 확인 문구)
+SCRIPTS = {
+    '1': ('create_excel_with_results.py', '기본 이미지-결과 매칭 Excel 생성',
+          '기본 이미지-결과 매칭 Excel 생성',
+          ['이미지 쌍 + 추론 결과 (30개 샘플)', '출력: image_analysis_results.xlsx'], None),
+    '2': ('create_excel_cell_images.py', '필터링 최적화 Excel 생성',
+          '필터링 최적화 Excel 생성',
+          ['이미지 쌍 + 추론 결과 (셀 기반 이미지)', '출력: image_pairs_with_filter.xlsx'], None),
+    '3': ('create_excel_merged.py', '완전 통합 Excel 생성 (전체 데이터)',
+          '완전 통합 Excel 생성 (권장)',
+          ['이미지 쌍 + 추론 결과 + DMT 분석 결과', '모든 데이터 처리 (7,917개 파일)',
+           '출력: merged_analysis_results.xlsx'],
+          '⚠️  주의: 전체 데이터 처리는 시간이 오래 걸릴 수 있습니다.'),
+}
+
 def print_banner():
     """프로그램 시작 배너 출력"""
     print("=" * 70)
@@ -31,43 +48,28 @@ def print_banner():
     print()
 
 def print_menu():
-    """메뉴 출력"""
+    """메뉴 출력 (SCRIPTS / ACTIONS 에서 생성)"""
     print("📋 사용 가능한 기능:")
     print()
-    print("1. 기본 이미지-결과 매칭 Excel 생성")
-    print("   └── 이미지 쌍 + 추론 결과 (30개 샘플)")
-    print("   └── 출력: image_analysis_results.xlsx")
-    print()
-    print("2. 필터링 최적화 Excel 생성")
-    print("   └── 이미지 쌍 + 추론 결과 (셀 기반 이미지)")
-    print("   └── 출력: image_pairs_with_filter.xlsx")
-    print()
-    print("3. 완전 통합 Excel 생성 (권장)")
-    print("   └── 이미지 쌍 + 추론 결과 + DMT 분석 결과")
-    print("   └── 모든 데이터 처리 (7,917개 파일)")
-    print("   └── 출력: merged_analysis_results.xlsx")
-    print()
-    print("4. 의존성 설치")
-    print("   └── 필요한 Python 패키지 설치")
-    print()
-    print("5. 가상환경 설정")
-    print("   └── Python 가상환경 생성 및 활성화")
-    print()
+    entries = [(key, title, details) for key, (_, _, title, details, _) in SCRIPTS.items()]
+    entries += [(key, title, details) for key, (title, details, _) in ACTIONS.items()]
+    for key, title, details in entries:
+        print(f"{key}. {title}")
+        for line in details:
+            print(f"   └── {line}")
+        print()
     print("0. 종료")
     print()
 
 def check_dependencies():
-    """필요한 패키지가 설치되어 있는지 확인"""
+    """필요한 패키지가 설치되어 있는지 확인 (import 없이 설치 메타데이터만 조회)"""
     required_packages = ['openpyxl', 'pillow']
     missing_packages = []
     
     for package in required_packages:
         try:
-            if package == 'pillow':
-                import PIL
-            else:
-                __import__(package)
-        except ImportError:
+            distribution(package)
+        except PackageNotFoundError:
             missing_packages.append(package)
     
     return missing_packages
@@ -79,18 +81,18 @@ def install_dependencies():
     
     packages = ['openpyxl', 'pillow']
     
-    for package in packages:
-        print(f"설치 중: {package}")
-        try:
-            result = subprocess.run([sys.executable, '-m', 'pip', 'install', package], 
-                                 capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"✅ {package} 설치 완료")
-            else:
-                print(f"❌ {package} 설치 실패: {result.stderr}")
-        except Exception as e:
-            print(f"❌ {package} 설치 중 오류: {e}")
-        print()
+    # pip 한 번 실행으로 일괄 설치 (출력은 실시간으로 그대로 표시)
+    print(f"설치 중: {', '.join(packages)}")
+    try:
+        result = subprocess.run([sys.executable, '-m', 'pip', 'install', '--disable-pip-version-check', *packages],
+                                text=True)
+        if result.returncode == 0:
+            print(f"✅ {', '.join(packages)} 설치 완료")
+        else:
+            print(f"❌ 패키지 설치 실패 (exit code {result.returncode})")
+    except Exception as e:
+        print(f"❌ 패키지 설치 중 오류: {e}")
+    print()
     
     print("패키지 설치 완료!")
 
@@ -125,13 +127,25 @@ def setup_venv():
         print(f"  source {venv_path}/bin/activate")
     print()
 
-def run_script(script_name, description):
-    """스크립트 실행"""
+def run_script(script_name, description, replace_process=False):
+    """스크립트 실행
+
+    replace_process=True 이면 (POSIX 한정) 현재 프로세스를 스크립트로 교체해
+    메뉴 프로세스가 자식 실행 동안 메모리에 남지 않게 합니다. 돌아오지 않습니다.
+    """
     print(f"🚀 {description}")
     print(f"실행 중: {script_name}")
     print("=" * 50)
     print()
     
+    if replace_process and os.name == 'posix':
+        if not os.path.exists(script_name):
+            print(f"❌ 스크립트 파일을 찾을 수 없습니다: {script_name}")
+            return 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execvp(sys.executable, [sys.executable, script_name])
+    
     try:
         # 현재 디렉토리에서 스크립트 실행
         result = subprocess.run([sys.executable, script_name], 
@@ -146,77 +160,77 @@ def run_script(script_name, description):
             print()
             print("=" * 50)
             print(f"❌ {description} 중 오류가 발생했습니다.")
+        return result.returncode
             
     except FileNotFoundError:
         print(f"❌ 스크립트 파일을 찾을 수 없습니다: {script_name}")
         print("현재 디렉토리에 해당 파일이 있는지 확인해주세요.")
     except Exception as e:
         print(f"❌ 실행 중 오류 발생: {e}")
+    return 1
+
+def run_once(choice):
+    """--run 지정 시: 메뉴 없이 해당 스크립트만 실행하고 종료"""
+    if choice not in SCRIPTS:
+        print(f"❌ 올바른 번호를 입력해주세요 ({', '.join(SCRIPTS)})")
+        return 2
+    missing = check_dependencies()
+    if missing:
+        print(f"❌ 필요한 패키지가 설치되지 않았습니다: {', '.join(missing)}")
+        print("먼저 '4. 의존성 설치'를 실행해주세요.")
+        return 1
+    script_name, description = SCRIPTS[choice][:2]
+    return run_script(script_name, description, replace_process=True)
+
+def run_menu_script(choice):
+    """메뉴에서 선택한 스크립트 실행 (의존성 확인, 필요 시 실행 전 확인)"""
+    script_name, description, _, _, warning = SCRIPTS[choice]
+    missing = check_dependencies()
+    if missing:
+        print(f"❌ 필요한 패키지가 설치되지 않았습니다: {', '.join(missing)}")
+        print("먼저 '4. 의존성 설치'를 실행해주세요.")
+        return
+    if warning:
+        print(warning)
+        confirm = input("계속하시겠습니까? (y/N): ").strip().lower()
+        if confirm not in ['y', 'yes']:
+            print("작업이 취소되었습니다.")
+            return
+    run_script(script_name, description)
+
+# 스크립트가 아닌 메뉴 항목: 번호 -> (메뉴 제목, 메뉴 상세, 실행 함수)
+ACTIONS = {
+    '4': ('의존성 설치', ['필요한 Python 패키지 설치'], install_dependencies),
+    '5': ('가상환경 설정', ['Python 가상환경 생성 및 활성화'], setup_venv),
+}
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="Image Analysis Excel Generator")
+    parser.add_argument("--run", metavar="N", choices=sorted(SCRIPTS), help=f"메뉴 없이 N번 기능을 바로 실행 ({', '.join(sorted(SCRIPTS))})")
+    args = parser.parse_args()
+    if args.run:
+        sys.exit(run_once(args.run))
+    
     print_banner()
+    last = max([*SCRIPTS, *ACTIONS], key=int)
     
     while True:
         print_menu()
         
         try:
-            choice = input("선택하세요 (0-5): ").strip()
+            choice = input(f"선택하세요 (0-{last}): ").strip()
             print()
             
             if choice == '0':
                 print("👋 프로그램을 종료합니다.")
                 break
-                
-            elif choice == '1':
-                # 의존성 확인
-                missing = check_dependencies()
-                if missing:
-                    print(f"❌ 필요한 패키지가 설치되지 않았습니다: {', '.join(missing)}")
-                    print("먼저 '4. 의존성 설치'를 실행해주세요.")
-                    print()
-                    continue
-                
-                run_script('create_excel_with_results.py', 
-                          '기본 이미지-결과 매칭 Excel 생성')
-                
-            elif choice == '2':
-                # 의존성 확인
-                missing = check_dependencies()
-                if missing:
-                    print(f"❌ 필요한 패키지가 설치되지 않았습니다: {', '.join(missing)}")
-                    print("먼저 '4. 의존성 설치'를 실행해주세요.")
-                    print()
-                    continue
-                
-                run_script('create_excel_cell_images.py', 
-                          '필터링 최적화 Excel 생성')
-                
-            elif choice == '3':
-                # 의존성 확인
-                missing = check_dependencies()
-                if missing:
-                    print(f"❌ 필요한 패키지가 설치되지 않았습니다: {', '.join(missing)}")
-                    print("먼저 '4. 의존성 설치'를 실행해주세요.")
-                    print()
-                    continue
-                
-                print("⚠️  주의: 전체 데이터 처리는 시간이 오래 걸릴 수 있습니다.")
-                confirm = input("계속하시겠습니까? (y/N): ").strip().lower()
-                if confirm in ['y', 'yes']:
-                    run_script('create_excel_merged.py', 
-                              '완전 통합 Excel 생성 (전체 데이터)')
-                else:
-                    print("작업이 취소되었습니다.")
-                
-            elif choice == '4':
-                install_dependencies()
-                
-            elif choice == '5':
-                setup_venv()
-                
+            elif choice in SCRIPTS:
+                run_menu_script(choice)
+            elif choice in ACTIONS:
+                ACTIONS[choice][2]()
             else:
-                print("❌ 올바른 번호를 입력해주세요 (0-5)")
+                print(f"❌ 올바른 번호를 입력해주세요 (0-{last})")
             
             print()
             input("계속하려면 Enter 키를 누르세요...")
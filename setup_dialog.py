@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import csv
+import itertools
 import os
 import sys
-import pandas as pd
+import time
+from concurrent.futures import ThreadPoolExecutor
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from utils import CSV_CONFIGS, detect_csv_type, resolve_image_path
@@ -23,6 +26,13 @@ class SetupWindow(QtWidgets.QDialog):
         self.images_base = ""
         self.json_base = ""
         self.csv_type = "report"  # 리포트 단일로 고정
+        # 경로 존재 여부 캐시: path -> (확인 시각, 존재 여부)
+        self._exists_cache = {}
+        # 마지막 매칭 테스트 결과: (csv_path, csv_mtime, images_base) -> (결과 텍스트, 색상, 시작 가능 여부)
+        self._last_test_key = None
+        self._last_test_result = None
+        # 설정 저장소는 한 번만 열어 재사용 (키 이름은 기존과 동일하게 유지)
+        self._qs = QtCore.QSettings("rtm", "inference_labeler")
 
         self._build_ui()
         self._load_default_paths()
@@ -204,7 +214,7 @@ class SetupWindow(QtWidgets.QDialog):
 
     def _try_restore_saved_paths(self):
         """초기화 시 저장된 경로가 있으면 자동으로 복원 시도"""
-        settings = QtCore.QSettings("rtm", "inference_labeler")
+        settings = self._qs
         last_csv_path = settings.value("last_csv_path", "")
         last_images_base = settings.value("last_images_base", "")
         last_json_base = settings.value("last_json_base", "")
@@ -240,6 +250,8 @@ class SetupWindow(QtWidgets.QDialog):
         if file_path:
             self.csv_path = file_path
             self.csv_path_edit.setText(file_path)
+            self._exists_cache.pop(file_path, None)
+            self._last_test_key = None
 
             # 리포트 단일 타입으로 고정되어 있으므로 별도 처리 불필요
             self._update_test_button_state()
@@ -255,6 +267,8 @@ class SetupWindow(QtWidgets.QDialog):
         if folder_path:
             self.images_base = folder_path
             self.images_path_edit.setText(folder_path)
+            self._exists_cache.pop(folder_path, None)
+            self._last_test_key = None
             self._update_test_button_state()
 
     def _browse_json(self):
@@ -268,12 +282,23 @@ class SetupWindow(QtWidgets.QDialog):
         if folder_path:
             self.json_base = folder_path
             self.json_path_edit.setText(folder_path)
+            self._exists_cache.pop(folder_path, None)
             self._update_test_button_state()
 
+    def _exists(self, path, ttl=2.0):
+        """os.path.exists 결과를 ttl초 동안 재사용 (네트워크 드라이브 등 느린 stat 대비)"""
+        now = time.monotonic()
+        hit = self._exists_cache.get(path)
+        if hit and now - hit[0] < ttl:
+            return hit[1]
+        found = bool(path) and os.path.exists(path)
+        self._exists_cache[path] = (now, found)
+        return found
+
     def _update_test_button_state(self):
         """테스트 버튼 활성화 상태 업데이트"""
         can_test = bool(self.csv_path and self.images_base and self.json_base and
-                       os.path.exists(self.csv_path) and os.path.exists(self.images_base) and os.path.exists(self.json_base))
+                       self._exists(self.csv_path) and self._exists(self.images_base) and self._exists(self.json_base))
         self.test_btn.setEnabled(can_test)
 
     def _run_matching_test(self):
@@ -282,28 +307,33 @@ class SetupWindow(QtWidgets.QDialog):
             return
 
         try:
-            # CSV 파일 로드
-            df = pd.read_csv(self.csv_path, nrows=100)  # 처음 100행만 테스트
-
-            if "File_path" not in df.columns:
-                self.test_result_label.setText("❌ CSV 파일에 'File_path' 컬럼이 없습니다.")
+            # 입력이 그대로면 이전 결과를 재사용
+            key = (self.csv_path, os.path.getmtime(self.csv_path), self.images_base)
+            if key == self._last_test_key:
+                self._show_test_result(*self._last_test_result)
                 return
 
-            # 이미지 매칭 테스트
-            total_rows = len(df)
-            matched_count = 0
-            sample_matches = []
-
-            for idx, row in df.iterrows():
-                file_path = row["File_path"]
-                if pd.isna(file_path) or not str(file_path).strip():
-                    continue
+            # CSV 앞부분만 스트리밍으로 읽음 (처음 100행만 테스트, pandas 불필요)
+            with open(self.csv_path, newline="", encoding="utf-8-sig") as f:
+                reader = csv.DictReader(f)
+                if "File_path" not in (reader.fieldnames or []):
+                    self.test_result_label.setText("❌ CSV 파일에 'File_path' 컬럼이 없습니다.")
+                    return
+                rows = list(itertools.islice(reader, 100))
 
-                resolved_path = resolve_image_path(self.images_base, str(file_path))
-                if os.path.exists(resolved_path):
-                    matched_count += 1
-                    if len(sample_matches) < 3:
-                        sample_matches.append(os.path.basename(resolved_path))
+            # 이미지 매칭 테스트
+            total_rows = len(rows)
+            paths = [p for p in (row.get("File_path") or "" for row in rows) if p.strip()]
+            # 경로 해석/존재 확인은 파일시스템 I/O 위주이므로 스레드로 병렬 처리 (순서 유지)
+            resolved = []
+            exists = []
+            if paths:
+                with ThreadPoolExecutor(max_workers=min(32, len(paths))) as ex:
+                    for r, e in ex.map(self._probe_image_path, paths):
+                        resolved.append(r)
+                        exists.append(e)
+            matched_count = sum(exists)
+            sample_matches = [os.path.basename(r) for r, e in zip(resolved, exists) if e][:3]
 
             # 결과 표시
             match_rate = (matched_count / total_rows * 100) if total_rows > 0 else 0
@@ -311,15 +341,15 @@ class SetupWindow(QtWidgets.QDialog):
             if match_rate > 80:
                 status = "✅"
                 color = "green"
-                self.start_btn.setEnabled(True)
+                can_start = True
             elif match_rate > 50:
                 status = "⚠️"
                 color = "orange"
-                self.start_btn.setEnabled(True)
+                can_start = True
             else:
                 status = "❌"
                 color = "red"
-                self.start_btn.setEnabled(False)
+                can_start = False
 
             result_text = f"{status} 매칭 테스트 결과:\n"
             result_text += f"전체 행: {total_rows:,}개\n"
@@ -331,13 +361,25 @@ class SetupWindow(QtWidgets.QDialog):
                 for match in sample_matches:
                     result_text += f"  • {match}\n"
 
-            self.test_result_label.setText(result_text)
-            self.test_result_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+            self._last_test_key = key
+            self._last_test_result = (result_text, color, can_start)
+            self._show_test_result(result_text, color, can_start)
 
         except Exception as e:
             self.test_result_label.setText(f"❌ 테스트 실행 중 오류 발생:\n{str(e)}")
             self.test_result_label.setStyleSheet("color: red; font-weight: bold;")
 
+    def _show_test_result(self, result_text, color, can_start):
+        """매칭 테스트 결과 표시"""
+        self.start_btn.setEnabled(can_start)
+        self.test_result_label.setText(result_text)
+        self.test_result_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+
+    def _probe_image_path(self, file_path):
+        """경로 해석 + 존재 여부 (해석 실패(None)는 존재하지 않는 것으로 처리)"""
+        resolved_path = resolve_image_path(self.images_base, file_path)
+        return resolved_path, bool(resolved_path) and os.path.exists(resolved_path)
+
     def get_settings(self):
         """설정값 반환"""
         return {
@@ -349,16 +391,26 @@ class SetupWindow(QtWidgets.QDialog):
 
     def save_paths_to_settings(self):
         """경로 설정을 QSettings에 저장"""
-        settings = QtCore.QSettings("rtm", "inference_labeler")
-        settings.setValue("last_csv_path", self.csv_path)
-        settings.setValue("last_images_base", self.images_base)
-        settings.setValue("last_json_base", self.json_base)
-        settings.setValue("last_csv_type", self.csv_type)
+        settings = self._qs
+        values = {
+            "last_csv_path": self.csv_path,
+            "last_images_base": self.images_base,
+            "last_json_base": self.json_base,
+            "last_csv_type": self.csv_type,
+        }
+        # 바뀐 값만 기록하고, 변경이 있을 때만 한 번 sync
+        changed = False
+        for key, value in values.items():
+            if settings.value(key, None) != value:
+                settings.setValue(key, value)
+                changed = True
+        if changed:
+            settings.sync()
         print(f"경로 설정 저장됨: CSV={self.csv_path}, 이미지={self.images_base}, JSON={self.json_base}")
 
     def load_paths_from_settings(self):
         """QSettings에서 마지막 경로 설정을 로드"""
-        settings = QtCore.QSettings("rtm", "inference_labeler")
+        settings = self._qs
         last_csv_path = settings.value("last_csv_path", "")
         last_images_base = settings.value("last_images_base", "")
         last_json_base = settings.value("last_json_base", "")
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""ImageLRU2 admission in pyside_labeler: a full cache must keep taking new images."""
+
+import unittest
+
+from pyside_labeler import ImageLRU2
+
+
+# Integer keys: their hashes (and so the TinyLFU sketch) do not vary with PYTHONHASHSEED
+def view(cache: ImageLRU2, key) -> bool:
+    """One image view as _set_image_on_label does it: get, then put on a miss. True if cached after."""
+    if cache.get(key) is None:
+        cache.put(key, object())
+    return key in cache
+
+
+class ImageCacheAdmission(unittest.TestCase):
+    def test_forward_pass_admits_every_new_key(self):
+        cache = ImageLRU2(5)
+        for i in range(50):
+            self.assertTrue(view(cache, i), i)
+        self.assertEqual(len(cache), 5)
+
+    def test_new_keys_admitted_past_the_window(self):
+        cache = ImageLRU2(5)
+        for _ in range(2):
+            for i in range(5):
+                view(cache, 1000 + i)
+        kept = []
+        for i in range(300):
+            self.assertTrue(view(cache, i), i)
+            kept.append(i - 1 in cache)  # pushed out of the window: admitted to the main area?
+        # Popular keys hold the main area at first; once their counts have aged, new keys get in
+        self.assertGreater(sum(kept[-100:]), 50)
+        self.assertEqual(len(cache), 5)
+
+    def test_repeated_key_survives_a_scan(self):
+        cache = ImageLRU2(5)
+        for _ in range(3):
+            view(cache, 1000)
+        for i in range(12):
+            view(cache, 2000 + i)
+        self.assertIn(1000, cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
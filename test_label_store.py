@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Label store loading in utils: stores written by stdlib json must never read back as empty."""
+
+import json
+import math
+import os
+import shutil
+import tempfile
+import unittest
+
+import utils
+
+
+class LabelStoreLoad(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "labels.json")
+
+    def tearDown(self) -> None:
+        utils._dirty_label_stores.pop(self.path, None)
+        utils._unreadable_label_stores.discard(self.path)
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def test_nan_literal_loads(self):
+        # stdlib json.dump writes NaN as a bare literal, which orjson rejects
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"labels": {"0": {"values": {"L": "ok", "score": float("nan")}}}}, f)
+        store = utils.load_label_store(self.path)
+        self.assertEqual(store["labels"]["0"]["values"]["L"], "ok")
+        self.assertTrue(math.isnan(store["labels"]["0"]["values"]["score"]))
+        self.assertTrue(utils.save_label_store(self.path, store))
+        self.assertEqual(utils.load_label_store(self.path)["labels"]["0"]["values"]["L"], "ok")
+
+    def test_unreadable_store_is_not_overwritten(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write('{"labels": {"0": {"values": {"L": "ok"}}')  # truncated
+        with open(self.path, "rb") as f:
+            before = f.read()
+        self.assertEqual(utils.load_label_store(self.path)["labels"], {})
+        self.assertFalse(utils.save_label_store(self.path, {"labels": {}}))
+        utils.upsert_json_entry(self.path, 1, {"values": {"L": "new"}})
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,8 +3,9 @@
 
 import os
 import csv
-import glob
-from typing import Optional
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from create_excel_from_seg_csv import normalize_relative_path, resolve_image_path
 
@@ -15,12 +16,48 @@ CSV_PATH = \
     "/Users/rtm/Downloads/seg/v0.3_inference_20250801_v0.2/inference_results.csv"
 
 
-def debug_resolve(images_base: str, csv_img_path: str) -> None:
+def _build_index(images_base: str) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+    """Walk images_base once: basename -> paths and stem (name without extension) -> paths."""
+    idx_base: Dict[str, List[str]] = {}
+    idx_stem: Dict[str, List[str]] = {}
+    for root, _, files in os.walk(images_base):
+        for f in files:
+            full = os.path.join(root, f)
+            idx_base.setdefault(f, []).append(full)
+            stem, _ = os.path.splitext(f)
+            idx_stem.setdefault(stem, []).append(full)
+    return idx_base, idx_stem
+
+
+@lru_cache(maxsize=1024)
+def _substring_pattern(text: str) -> "re.Pattern[str]":
+    """Compiled literal-substring pattern, compiled once per distinct stem."""
+    return re.compile(re.escape(text))
+
+
+def _stems_containing(stems_sorted: List[str], text: str) -> List[str]:
+    """Stems that contain text; short needles use a plain `in` check, which beats a regex."""
+    if len(text) < 8:
+        return [s for s in stems_sorted if text in s]
+    search = _substring_pattern(text).search
+    return [s for s in stems_sorted if search(s)]
+
+
+def debug_resolve(images_base: str, csv_img_path: str,
+                  idx_base: Dict[str, List[str]], idx_stem: Dict[str, List[str]],
+                  stems_sorted: Optional[List[str]] = None) -> None:
     rel = normalize_relative_path(csv_img_path)
-    candidate = os.path.join(images_base, rel)
     rel_dir = os.path.dirname(rel)
     rel_base, _ = os.path.splitext(os.path.basename(rel))
-    viz_candidate = os.path.join(images_base, rel_dir, f"{rel_base}_viz.png")
+    if os.path.isabs(rel):
+        candidate = os.path.join(images_base, rel)
+        viz_candidate = os.path.join(images_base, rel_dir, f"{rel_base}_viz.png")
+    else:
+        # rel is normalized and relative here, so concatenation matches os.path.join
+        sep = os.sep
+        candidate = f"{images_base}{sep}{rel}"
+        viz_dir = f"{images_base}{sep}{rel_dir}" if rel_dir else images_base
+        viz_candidate = f"{viz_dir}{sep}{rel_base}_viz.png"
 
     print(f"csv_img_path     : {csv_img_path}")
     print(f"rel              : {rel}")
@@ -29,14 +66,17 @@ def debug_resolve(images_base: str, csv_img_path: str) -> None:
 
     basename = os.path.basename(rel)
     base_no_ext, _ = os.path.splitext(basename)
-    patterns = [
-        os.path.join(images_base, "**", basename),
-        os.path.join(images_base, "**", f"{base_no_ext}.*"),
-        os.path.join(images_base, "**", f"*{base_no_ext}*.*"),
+    if stems_sorted is None:
+        stems_sorted = sorted(idx_stem)
+    # Same three lookups the recursive globs did, answered from the prebuilt index
+    lookups = [
+        (os.path.join(images_base, "**", basename), idx_base.get(basename, [])),
+        (os.path.join(images_base, "**", f"{base_no_ext}.*"), idx_stem.get(base_no_ext, [])),
+        (os.path.join(images_base, "**", f"*{base_no_ext}*.*"),
+         [m for stem in _stems_containing(stems_sorted, base_no_ext) for m in idx_stem[stem]]),
     ]
-    for p in patterns:
-        matches = glob.glob(p, recursive=True)
-        print(f"glob {p} -> {len(matches)} match(es)")
+    for p, matches in lookups:
+        print(f"index {p} -> {len(matches)} match(es)")
         for m in matches[:3]:
             print(f"  - {m}")
 
@@ -46,12 +86,17 @@ def debug_resolve(images_base: str, csv_img_path: str) -> None:
 
 
 def main():
+    idx_base, idx_stem = _build_index(IMAGES_BASE)
+    stems_sorted = sorted(idx_stem)
     with open(CSV_PATH, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, [])
+        col = header.index('img_path') if 'img_path' in header else None
         for i, row in enumerate(reader):
             if i >= 20:
                 break
-            debug_resolve(IMAGES_BASE, row.get('img_path', ''))
+            img_path = row[col] if col is not None and col < len(row) else ''
+            debug_resolve(IMAGES_BASE, img_path, idx_base, idx_stem, stems_sorted)
 
 
 if __name__ == "__main__":
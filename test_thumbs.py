@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Thumbnail prebuild in utils: parallel builds land in the cache in input order."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from PIL import Image
+
+import utils
+
+
+class PrebuildThumbs(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def _image(self, name: str, size) -> str:
+        path = os.path.join(self.dir, name)
+        Image.new("RGB", size, (200, 30, 30)).save(path)
+        return path
+
+    def test_builds_in_order_and_reuses_cache(self):
+        sources = [self._image(f"img{i}.png", (400 + i, 300)) for i in range(6)]
+        small = self._image("small.png", (50, 40))
+        paths = sources + [small]
+        thumbs = utils.prebuild_thumbs(self.dir, paths, 128, max_workers=3)
+        self.assertEqual(len(thumbs), len(paths))
+        self.assertEqual(thumbs[-1], small)  # already under target_edge: the source itself
+        for src, thumb in zip(sources, thumbs):
+            self.assertEqual(thumb, utils.thumb_cache_path(self.dir, src, 128))
+            with Image.open(thumb) as im:
+                self.assertLessEqual(max(im.size), 128)
+        cache_dir = os.path.join(self.dir, ".thumb_cache")
+        self.assertFalse([f for f in os.listdir(cache_dir) if f.endswith(".tmp")])
+        self.assertEqual(utils.prebuild_thumbs(self.dir, paths, 128), thumbs)
+
+    def test_empty(self):
+        self.assertEqual(utils.prebuild_thumbs(self.dir, [], 128), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
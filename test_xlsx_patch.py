@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Round trips for the sparse .xlsx patch in utils: patched files must re-open in openpyxl."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
+
+import utils
+
+SHEET = "Data"
+
+
+class XlsxPatchRoundTrip(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "book.xlsx")
+        wb = Workbook()
+        ws = wb.active
+        ws.title = SHEET
+        ws.append(["img_path", "L", "M", "N"])
+        for i in range(20):
+            ws.append([f"img{i}.png", "old" if i % 3 == 0 else None, i, None])
+        ws["B2"].font = Font(bold=True)
+        for col in range(1, 5):  # row 11 has no cells at all
+            ws.cell(row=11, column=col).value = None
+        wb.save(self.path)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def _patch(self, cells) -> bool:
+        return utils._patch_xlsx_cells(self.path, SHEET, cells)
+
+    def _values(self):
+        return [list(r) for r in load_workbook(self.path)[SHEET].iter_rows(values_only=True)]
+
+    def test_existing_cell_keeps_style(self):
+        self.assertTrue(self._patch({2: {2: "new"}}))
+        ws = load_workbook(self.path)[SHEET]
+        self.assertEqual(ws["B2"].value, "new")
+        self.assertTrue(ws["B2"].font.b)
+
+    def test_new_row(self):
+        self.assertTrue(self._patch({11: {2: "gap", 4: 2.5}}))
+        rows = self._values()
+        self.assertEqual(rows[10], [None, "gap", None, 2.5])
+        self.assertEqual(rows[11][0], "img10.png")
+
+    def test_inline_and_shared_strings(self):
+        # Patched text is written inline; untouched cells keep their shared strings
+        self.assertTrue(self._patch({5: {2: " pad & <x> "}, 6: {3: True}}))
+        rows = self._values()
+        self.assertEqual(rows[4][1], " pad & <x> ")
+        self.assertIs(rows[5][2], True)
+        self.assertEqual(rows[3][0], "img2.png")
+        self.assertEqual(rows[4][0], "img3.png")
+        self.assertEqual(load_workbook(self.path, read_only=True)[SHEET]["B5"].value, " pad & <x> ")
+
+    def test_unsupported_values_fall_back(self):
+        with open(self.path, "rb") as f:
+            before = f.read()
+        for cells in ({3: {2: float("nan")}}, {3: {2: "bad\x01char"}}, {3: {2: "=SUM(C2:C3)"}}):
+            self.assertFalse(self._patch(cells), cells)
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), before)
+
+    def test_growth_falls_back(self):
+        self.assertFalse(self._patch({30: {2: "x"}}))
+        self.assertFalse(self._patch({3: {9: "x"}}))
+
+    def test_missing_or_single_cell_dimension_falls_back(self):
+        xml = '<worksheet><sheetData><row r="1"><c r="A1"><v>1</v></c></row></sheetData></worksheet>'
+        self.assertIsNone(utils._patch_sheet_xml(xml, {1: {1: 2}}))
+        single = xml.replace("<sheetData>", '<dimension ref="A1"/><sheetData>')
+        self.assertIsNone(utils._patch_sheet_xml(single, {1: {1: 2}}))
+        ranged = xml.replace("<sheetData>", '<dimension ref="A1:B2"/><sheetData>')
+        self.assertIsNotNone(utils._patch_sheet_xml(ranged, {1: {1: 2}}))
+
+    def test_apply_json_matches_openpyxl_path(self):
+        other = os.path.join(self.dir, "other.xlsx")
+        shutil.copy(self.path, other)
+        json_path = os.path.join(self.dir, "labels.json")
+        labels = {"0": {"values": {"L": "ok"}}, "9": {"values": {"L": "gap", "N": 1.5}}, "19": {"values": {"M": 7}}}
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"labels": labels}, f)
+        cols = {"L": 2, "M": 3, "N": 4}
+
+        def frame():
+            return pd.DataFrame({"L": [None] * 20, "M": [None] * 20, "N": [None] * 20}).astype(object)
+
+        patched = []
+        real_patch = utils._patch_xlsx_cells
+        with mock.patch.object(utils, "SPARSE_PATCH_RATIO", 1), \
+                mock.patch.object(utils, "_patch_xlsx_cells", side_effect=lambda *a: patched.append(real_patch(*a)) or patched[-1]):
+            utils.apply_json_to_excel(json_path, self.path, SHEET, cols, frame())
+        self.assertEqual(patched, [True])
+        with mock.patch.object(utils, "SPARSE_PATCH_RATIO", 0):
+            utils.apply_json_to_excel(json_path, other, SHEET, cols, frame())
+        self.assertEqual(self._values(), [list(r) for r in load_workbook(other)[SHEET].iter_rows(values_only=True)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,27 +3,56 @@
 
 import os
 import sys
+import atexit
+import copy
 import json
 import hashlib
+import math
 import re
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape as xml_escape
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 try:
     # Python 3.11+
     from datetime import UTC as _UTC
 except Exception:
     from datetime import timezone as _tz
     _UTC = _tz.utc
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 import gc
 import psutil
 
-import pandas as pd
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from openpyxl import load_workbook
 
 # Reuse path resolution from the existing module
 from create_excel_from_seg_csv import resolve_image_path
+try:
+    # Optional: faster resize + WebP encode for thumbnails (Qt is used otherwise)
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
+try:
+    # Optional: streaming parser for large result JSON files
+    import ijson
+except ImportError:
+    ijson = None
+try:
+    # Optional: C JSON codec for label stores and result files (stdlib json otherwise)
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    # pandas is imported lazily by the functions that need it so that light
+    # importers (e.g. the setup dialog) do not pay its start-up cost
+    import pandas as pd
 
     # CSV 타입별 경로 설정
 CSV_CONFIGS = {
@@ -39,17 +68,49 @@ def detect_csv_type(csv_path: str) -> str:
     # 모든 CSV 파일을 report 타입으로 처리
     return "report"
 
+def _json_loads(data):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity literals that stdlib json.dump writes; stdlib json reads them
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Indented UTF-8 JSON, matching json.dump(obj, ensure_ascii=False, indent=2)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass  # a type orjson does not handle; let stdlib json have a go
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def get_csv_config(csv_path: str) -> dict:
     """CSV 파일 경로에 맞는 설정을 반환합니다."""
     csv_type = detect_csv_type(csv_path)
     return CSV_CONFIGS.get(csv_type, CSV_CONFIGS["report"])
 
 # Memory management utilities
-def get_memory_usage():
-    """Get current memory usage in MB"""
+_MEM_SAMPLE_TTL = 0.2  # seconds; RSS is re-read at most this often
+_last_mem: float = 0.0
+_last_mem_t: Optional[float] = None
+_process: Optional[psutil.Process] = None
+
+
+def get_memory_usage(fresh: bool = False):
+    """Get current memory usage in MB (sampled at most every 200 ms unless fresh=True)"""
+    global _last_mem, _last_mem_t, _process
+    now = time.monotonic()
+    if not fresh and _last_mem_t is not None and now - _last_mem_t < _MEM_SAMPLE_TTL:
+        return _last_mem
     try:
-        process = psutil.Process(os.getpid())
-        return process.memory_info().rss / 1024 / 1024
+        if _process is None or _process.pid != os.getpid():
+            _process = psutil.Process(os.getpid())
+        _last_mem = _process.memory_info().rss / 1024 / 1024
+        _last_mem_t = now
+        return _last_mem
     except:
         return 0
 
@@ -61,12 +122,23 @@ def force_garbage_collection():
     """Force garbage collection to free memory"""
     gc.collect()
 
+_SYSTEM_MEM_TOTAL: Optional[float] = None
+
+
 def get_system_memory():
-    """Get total system memory in MB"""
-    try:
-        return psutil.virtual_memory().total / 1024 / 1024
-    except:
-        return 8192  # Default to 8GB if can't detect
+    """Get total system memory in MB (read once; it does not change while running)"""
+    global _SYSTEM_MEM_TOTAL
+    if _SYSTEM_MEM_TOTAL is None:
+        try:
+            _SYSTEM_MEM_TOTAL = psutil.virtual_memory().total / 1024 / 1024
+        except:
+            return 8192  # Default to 8GB if can't detect
+    return _SYSTEM_MEM_TOTAL
+
+
+# Separators: ASCII/full-width semicolon and comma, all folded to "," before splitting
+_SEP_TRANS = str.maketrans({";": ",", "\uFF1B": ",", "\uFF0C": ","})
+_STRIP_CHARS = "[](){}"
 
 
 def parse_pred_list(value) -> List[str]:
@@ -74,222 +146,685 @@ def parse_pred_list(value) -> List[str]:
     Handles JSON arrays, python-like list strings, or comma-separated strings.
     """
     try:
-        if isinstance(value, (list, tuple, set)):
-            return [str(x).strip() for x in value]
-        s = str(value).strip()
+        if value is None:
+            return []
+        if type(value) is str:
+            s = value.strip()
+        else:
+            if isinstance(value, (list, tuple, set)):
+                return [str(x).strip() for x in value]
+            s = str(value).strip()
         if not s:
             return []
         # Try JSON first
-        if s.startswith("[") or s.startswith("{"):
+        if s[:1] in "[{":
             try:
-                data = json.loads(s)
+                data = _json_loads(s)
                 if isinstance(data, (list, tuple, set)):
                     return [str(x).strip() for x in data]
             except Exception:
                 pass
         # Fallback: strip brackets and split by semicolon/comma variants
-        s2 = s.strip().strip('[](){}')
-        parts = [p.strip().strip("'\"") for p in re.split(r"[;,\uFF1B\uFF0C]+", s2) if p.strip()]
+        s2 = s.strip(_STRIP_CHARS)
+        if ";" in s2 or "\uFF1B" in s2 or "\uFF0C" in s2:
+            s2 = s2.translate(_SEP_TRANS)
+        # Labels come from a small vocabulary repeated on every row: intern to share the strings
+        parts = [sys.intern(p.strip().strip("'\"")) for p in s2.split(",") if p.strip()]
         return parts
     except Exception:
         return []
 
 
+def parse_pred_list_series(series: "pd.Series") -> "pd.Series":
+    """Apply parse_pred_list over a whole column (one list per row)."""
+    return series.map(parse_pred_list)
+
+
 def extract_detail_from_json(json_path: str) -> List[str]:
-    """JSON 파일에서 detail 정보를 추출합니다."""
-    if not json_path or not os.path.exists(json_path):
+    """JSON 파일에서 detail 정보를 추출합니다. (파일 수정 시각/크기 기준으로 캐시)"""
+    if not json_path:
         return []
+    try:
+        st = os.stat(json_path)
+    except OSError:
+        return []
+    return list(_extract_detail_cached(json_path, st.st_mtime_ns, st.st_size))
+
+
+_DETAIL_KEYS = ("detail", "details", "defects", "issues", "problems", "anomalies")
+# Below this size a plain parse is cheaper than streaming
+_STREAM_JSON_MIN_BYTES = 64 * 1024
+
+
+def _annotation_detail(ann) -> Optional[str]:
+    # 어노테이션 정보에서 detail 추출
+    if not isinstance(ann, dict):
+        return None
+    label = ann.get('label', '')
+    score = ann.get('score', 0.0)
+    bbox = ann.get('bbox', [])
+    if not label:
+        return None
+    detail = f"{label} (신뢰도: {score:.3f})"
+    if bbox and len(bbox) == 4:
+        detail += f" 위치: [{bbox[0]}, {bbox[1]}, {bbox[2]}, {bbox[3]}]"
+    return detail
+
+
+def _keyed_details(data: dict) -> List[str]:
+    """detail / details / defects 등 키에서 추출 (data는 _DETAIL_KEYS 값만 있어도 됨)"""
+    details = []
+    # 기존 detail 키가 있는 경우
+    if 'detail' in data:
+        detail_data = data['detail']
+        if isinstance(detail_data, list):
+            details.extend([str(item) for item in detail_data])
+        elif isinstance(detail_data, str):
+            details.append(detail_data)
+        elif isinstance(detail_data, dict):
+            # detail이 dict인 경우 모든 값 추출
+            for key, value in detail_data.items():
+                details.append(f"{key}: {value}")
+
+    # 다른 가능한 구조들
+    elif 'details' in data:
+        detail_data = data['details']
+        if isinstance(detail_data, list):
+            details.extend([str(item) for item in detail_data])
+        elif isinstance(detail_data, str):
+            details.append(detail_data)
+
+    # 전체 데이터에서 특정 패턴 찾기
+    else:
+        # defects, issues 등의 키 탐색
+        for key in ['defects', 'issues', 'problems', 'anomalies']:
+            if key in data:
+                items = data[key]
+                if isinstance(items, list):
+                    details.extend([str(item) for item in items])
+                break
+    return details
+
 
+def _stream_details(f) -> List[str]:
+    """Same result as parsing the whole file, but builds one annotation (or list item) at a time.
+
+    Only the annotations items and the top-level _DETAIL_KEYS values are materialized.
+    """
+    events = ijson.parse(f, use_float=True)
+    _, root, _ = next(events)
+    if root not in ("start_map", "start_array"):
+        return []
+    details: List[str] = []
+    keyed: Dict[str, object] = {}
+    builder = None
+    depth = 0
+    target = ""
+    for prefix, event, value in events:
+        if builder is None:
+            if root == "start_map":
+                if prefix == "annotations.item" and event == "start_map":
+                    target = prefix
+                elif prefix in _DETAIL_KEYS:
+                    target = prefix
+                else:
+                    continue
+            elif prefix == "item" and event != "end_array":
+                target = prefix
+            else:
+                continue
+            builder = ijson.ObjectBuilder()
+            depth = 0
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+        if depth:
+            continue
+        if target == "annotations.item":
+            detail = _annotation_detail(builder.value)
+            if detail:
+                details.append(detail)
+        elif target == "item":
+            details.append(str(builder.value))
+        else:
+            keyed[target] = builder.value
+        builder = None
+    if root == "start_map":
+        details.extend(_keyed_details(keyed))
+    return details
+
+
+@lru_cache(maxsize=4096)
+def _extract_detail_cached(json_path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    # mtime_ns/size are only part of the cache key: a rewritten file misses the cache
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(json_path, 'rb') as f:
+            if ijson is not None and size >= _STREAM_JSON_MIN_BYTES:
+                # 큰 결과 파일은 전체 트리를 만들지 않고 스트리밍으로 추출
+                return tuple(_stream_details(f))
+            data = _json_loads(f.read())
 
         details = []
 
         # JSON 구조에 따라 detail 정보 추출
         if isinstance(data, dict):
-            # 어노테이션 정보에서 detail 추출
             if 'annotations' in data and isinstance(data['annotations'], list):
                 for ann in data['annotations']:
-                    if isinstance(ann, dict):
-                        label = ann.get('label', '')
-                        score = ann.get('score', 0.0)
-                        bbox = ann.get('bbox', [])
-                        if label:
-                            detail = f"{label} (신뢰도: {score:.3f})"
-                            if bbox and len(bbox) == 4:
-                                detail += f" 위치: [{bbox[0]}, {bbox[1]}, {bbox[2]}, {bbox[3]}]"
-                            details.append(detail)
-
-            # 기존 detail 키가 있는 경우
-            if 'detail' in data:
-                detail_data = data['detail']
-                if isinstance(detail_data, list):
-                    details.extend([str(item) for item in detail_data])
-                elif isinstance(detail_data, str):
-                    details.append(detail_data)
-                elif isinstance(detail_data, dict):
-                    # detail이 dict인 경우 모든 값 추출
-                    for key, value in detail_data.items():
-                        details.append(f"{key}: {value}")
-
-            # 다른 가능한 구조들
-            elif 'details' in data:
-                detail_data = data['details']
-                if isinstance(detail_data, list):
-                    details.extend([str(item) for item in detail_data])
-                elif isinstance(detail_data, str):
-                    details.append(detail_data)
-
-            # 전체 데이터에서 특정 패턴 찾기
-            else:
-                # defects, issues 등의 키 탐색
-                for key in ['defects', 'issues', 'problems', 'anomalies']:
-                    if key in data:
-                        items = data[key]
-                        if isinstance(items, list):
-                            details.extend([str(item) for item in items])
-                        break
+                    detail = _annotation_detail(ann)
+                    if detail:
+                        details.append(detail)
+            details.extend(_keyed_details(data))
 
         elif isinstance(data, list):
             # JSON이 리스트인 경우
             details.extend([str(item) for item in data])
 
-        return details
+        return tuple(details)
 
     except Exception as e:
         print(f"JSON 파일 파싱 오류 ({json_path}): {e}")
-        return []
+        return ()
 
 
-def ensure_object_dtype(df: pd.DataFrame, column: str) -> None:
+# Lets callers drop cached details when result JSON files are regenerated
+extract_detail_from_json.cache_clear = _extract_detail_cached.cache_clear
+
+
+def ensure_object_dtype(df: "pd.DataFrame", column: str) -> None:
     try:
         df[column] = df[column].astype("object")
     except Exception:
         pass
 
 
-def default_json_path(xlsx_path: str) -> str:
-    base = os.path.basename(xlsx_path)
-    root, _ = os.path.splitext(base)
-    parent = os.path.dirname(xlsx_path) or os.getcwd()
+@lru_cache(maxsize=256)
+def _json_path_candidates(xlsx_path: str) -> Tuple[str, str]:
+    """(new, legacy) label JSON paths for a workbook; pure string work, so cached."""
+    sep = xlsx_path.rfind(os.sep)
+    if os.altsep:
+        sep = max(sep, xlsx_path.rfind(os.altsep))
+    base = xlsx_path[sep + 1:]
+    dot = base.rfind(".")
+    # Like os.path.splitext: dots leading the name do not start an extension
+    root = base[:dot] if dot >= len(base) - len(base.lstrip(".")) else base
     # Preferred naming: if Excel is *_labeled.xlsx → JSON is *_labels.json
     if root.endswith("_labeled"):
         new_root = root[: -len("_labeled")] + "_labels"
     else:
         new_root = root + "_labels"
-    new_path = os.path.join(parent, f"{new_root}.json")
     # Legacy path compatibility: previously always appended _labels
-    legacy_path = os.path.join(parent, f"{root}_labels.json")
-    # If legacy exists and new doesn't, keep using legacy for seamless migration
-    if os.path.exists(legacy_path) and not os.path.exists(new_path):
-        return legacy_path
-    return new_path
+    return f"{new_root}.json", f"{root}_labels.json"
+
+
+def default_json_path(xlsx_path: str) -> str:
+    new_name, legacy_name = _json_path_candidates(xlsx_path)
+    parent = os.path.dirname(xlsx_path) or os.getcwd()
+    new_path = os.path.join(parent, new_name)
+    # If legacy exists and new doesn't, keep using legacy for seamless migration.
+    # Only *_labeled names differ; the usual case needs no stat, else new is stat'ed first
+    if legacy_name == new_name or os.path.exists(new_path):
+        return new_path
+    legacy_path = os.path.join(parent, legacy_name)
+    return legacy_path if os.path.exists(legacy_path) else new_path
+
+
+# Stores with more entries than this get their label strings interned on load
+LABEL_INTERN_MIN = 1000
+
+
+def _intern_label_values(labels: dict, intern_cols: Optional[Tuple[str, ...]] = None) -> None:
+    """Share the few distinct label strings across all entries, in place.
+
+    intern_cols limits interning to those columns (free-text notes gain nothing). Keys are
+    left alone: the JSON decoders already reuse one string per repeated key.
+    """
+    intern = sys.intern
+    for entry in labels.values():
+        values = entry.get("values") if isinstance(entry, dict) else None
+        if not isinstance(values, dict):
+            continue
+        for k, v in values.items():
+            if type(v) is str and (intern_cols is None or k in intern_cols):
+                values[k] = intern(v)  # same key: no resize while iterating
+
 
+# Stores that exist but could not be parsed: saving over them would drop every label
+_unreadable_label_stores: Set[str] = set()
 
-def load_label_store(json_path: str) -> dict:
+
+def load_label_store(json_path: str, intern_cols: Optional[Tuple[str, ...]] = None) -> dict:
+    # Write-behind upserts still pending for this path go to disk first, so this read sees them
+    if json_path in _dirty_label_stores and not flush_label_store(json_path):
+        return copy.deepcopy(_dirty_label_stores[json_path])
     if not json_path or not os.path.exists(json_path):
+        _unreadable_label_stores.discard(json_path)
         return {"version": 1, "updated_at": None, "labels": {}}
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(json_path, "rb") as f:
+            data = _json_loads(f.read())
             if isinstance(data, dict) and "labels" in data:
+                labels = data["labels"]
+                if isinstance(labels, dict) and len(labels) > LABEL_INTERN_MIN:
+                    _intern_label_values(labels, intern_cols)
+                _unreadable_label_stores.discard(json_path)
                 return data
     except Exception:
         pass
+    # save_label_store refuses this path until a later load parses it
+    _unreadable_label_stores.add(json_path)
     return {"version": 1, "updated_at": None, "labels": {}}
 
 
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+# json_path -> (file stamp, parsed store)
+_label_store_cache: Dict[str, Tuple[Optional[Tuple[int, int]], dict]] = {}
+
+
+def load_label_store_cached(json_path: str) -> dict:
+    """Like load_label_store, but reuses the parsed store while the file is unchanged.
+
+    The returned dict is shared between callers; only mutate it when saving it right after.
+    """
+    if not json_path:
+        return load_label_store(json_path)
+    pending = _dirty_label_stores.get(json_path)
+    if pending is not None:
+        return pending
+    stamp = _file_stamp(json_path)
+    hit = _label_store_cache.get(json_path)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    store = load_label_store(json_path)
+    _label_store_cache[json_path] = (stamp, store)
+    return store
+
+
 def save_label_store(json_path: str, store: dict) -> bool:
-    """Atomically persist the label store. Returns True on success."""
+    """Atomically persist the label store. Returns True on success.
+
+    Refuses (False) while the existing file at json_path could not be parsed.
+    """
+    if json_path in _unreadable_label_stores:
+        print(f"라벨 JSON을 읽을 수 없어 덮어쓰지 않습니다 ({json_path})")
+        return False
     try:
         store["updated_at"] = datetime.now(_UTC).isoformat()
         tmp = json_path + ".tmp"
         os.makedirs(os.path.dirname(json_path) or ".", exist_ok=True)
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(store, f, ensure_ascii=False, indent=2)
+        with open(tmp, "wb") as f:
+            f.write(_json_dumps(store))
         os.replace(tmp, json_path)
+        _dirty_label_stores.pop(json_path, None)
+        # The store just written is the current file content: later cached reads skip the parse
+        _label_store_cache[json_path] = (_file_stamp(json_path), store)
         return True
     except Exception:
         return False
 
 
-def apply_json_to_excel(json_path: str, xlsx_path: str, sheet_name: str, col_indices: Dict[str, int], df: pd.DataFrame) -> int:
-    store = load_label_store(json_path)
+# Fewer written rows than this share of the frame: patch the sheet XML instead of an openpyxl round trip
+SPARSE_PATCH_RATIO = 0.01
+
+_NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_NS_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_XML_ROW_RE = re.compile(r'<row\b[^>]*?(?:/>|>.*?</row>)', re.S)
+_XML_CELL_RE = re.compile(r'<c\b[^>]*?(?:/>|>.*?</c>)', re.S)
+_XML_R_ATTR_RE = re.compile(r'\br="([A-Z]*)(\d+)"')
+_XML_STYLE_ATTR_RE = re.compile(r'\bs="\d+"')
+_XML_SPANS_ATTR_RE = re.compile(r'\sspans="[^"]*"')
+_XML_DIMENSION_RE = re.compile(r'<dimension\b[^>]*\bref="[A-Z]+\d+:([A-Z]+)(\d+)"')
+_XML_ILLEGAL_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _col_letter(idx: int) -> str:
+    letters = ""
+    while idx > 0:
+        idx, rem = divmod(idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _col_number(letters: str) -> int:
+    n = 0
+    for ch in letters:
+        n = n * 26 + ord(ch) - 64
+    return n
+
+
+def _xml_cell(ref: str, style: str, val) -> Optional[str]:
+    """<c> element for val the way openpyxl would store it; None if the patch cannot represent it."""
+    if val is None:
+        return f'<c r="{ref}"{style}/>'
+    if isinstance(val, bool):
+        return f'<c r="{ref}"{style} t="b"><v>{int(val)}</v></c>'
+    if isinstance(val, (int, float)):
+        if isinstance(val, float) and not math.isfinite(val):
+            return None
+        return f'<c r="{ref}"{style}><v>{val!r}</v></c>'
+    if isinstance(val, str):
+        # Formulas, illegal characters and over-long text take the openpyxl path
+        if val.startswith("=") or len(val) > 32767 or _XML_ILLEGAL_RE.search(val):
+            return None
+        space = ' xml:space="preserve"' if val != val.strip() else ""
+        return f'<c r="{ref}"{style} t="inlineStr"><is><t{space}>{xml_escape(val)}</t></is></c>'
+    return None
+
+
+def _sheet_part(zf: zipfile.ZipFile, sheet_name: str) -> Optional[str]:
+    """Zip member holding sheet_name's worksheet XML."""
+    wb_root = ET.fromstring(zf.read("xl/workbook.xml"))
+    rel_id = None
+    for sh in wb_root.iter(f"{_NS_MAIN}sheet"):
+        if sh.get("name") == sheet_name:
+            rel_id = sh.get(f"{_NS_REL}id")
+            break
+    if rel_id is None:
+        return None
+    rels_root = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+    for rel in rels_root.iter(f"{_NS_PKG_REL}Relationship"):
+        if rel.get("Id") == rel_id:
+            target = rel.get("Target", "")
+            return target.lstrip("/") if target.startswith("/") else "xl/" + target
+    return None
+
+
+def _patch_sheet_xml(xml: str, cells: Dict[int, Dict[int, object]]) -> Optional[str]:
+    """Set cells ({excel_row: {col: value}}) in worksheet XML text; None if unsafe to patch."""
+    start = xml.find("<sheetData")
+    if start < 0:
+        return None
+    open_end = xml.index(">", start) + 1
+    if xml[open_end - 2] == "/":  # <sheetData/>: no rows yet
+        head, body, tail = xml[:start] + "<sheetData>", "", "</sheetData>" + xml[open_end:]
+    else:
+        close = xml.find("</sheetData>", open_end)
+        if close < 0:
+            return None
+        head, body, tail = xml[:open_end], xml[open_end:close], xml[close:]
+    # Growing the used range would also mean rewriting <dimension>; without a
+    # range to check against (missing, or a single cell like "A1") fall back too
+    dim = _XML_DIMENSION_RE.search(xml[:start])
+    if dim is None:
+        return None
+    max_col, max_row = _col_number(dim.group(1)), int(dim.group(2))
+    if max(cells) > max_row or any(c > max_col for row in cells.values() for c in row):
+        return None
+
+    rows: List[Tuple[int, int, int]] = []  # (row number, start, end) within body
+    for m in _XML_ROW_RE.finditer(body):
+        r = re.search(r'\br="(\d+)"', body[m.start():body.index(">", m.start())])
+        if r is None:
+            return None
+        rows.append((int(r.group(1)), m.start(), m.end()))
+    row_at = {num: (a, b) for num, a, b in rows}
+
+    edits: List[Tuple[int, int, str]] = []  # (start, end, replacement) within body
+    for row_num in sorted(cells):
+        if row_num in row_at:
+            a, b = row_at[row_num]
+            row_xml = body[a:b]
+            tag_end = row_xml.index(">") + 1
+            open_tag = _XML_SPANS_ATTR_RE.sub("", row_xml[:tag_end])
+            if open_tag.endswith("/>"):
+                open_tag = open_tag[:-2].rstrip() + ">"
+            existing = []
+            for cm in _XML_CELL_RE.finditer(row_xml, tag_end):
+                ref = _XML_R_ATTR_RE.search(cm.group(0)[:cm.group(0).index(">")])
+                if ref is None:
+                    return None
+                existing.append((_col_number(ref.group(1)), cm.group(0)))
+        else:
+            a = b = next((s for num, s, _e in rows if num > row_num), len(body))
+            open_tag, existing = f'<row r="{row_num}">', []
+        merged = dict(existing)
+        for col, val in cells[row_num].items():
+            old = merged.get(col, "")
+            if "<f" in old:
+                return None  # keep formulas (shared ones especially) to openpyxl
+            style = _XML_STYLE_ATTR_RE.search(old[:old.find(">") + 1]) if old else None
+            cell = _xml_cell(f"{_col_letter(col)}{row_num}", f" {style.group(0)}" if style else "", val)
+            if cell is None:
+                return None
+            merged[col] = cell
+        new_row = open_tag + "".join(merged[c] for c in sorted(merged)) + "</row>"
+        edits.append((a, b, new_row))
+
+    out = []
+    pos = 0
+    for a, b, text in sorted(edits, key=lambda e: (e[0], e[1])):
+        out.append(body[pos:a])
+        out.append(text)
+        pos = b
+    out.append(body[pos:])
+    return head + "".join(out) + tail
+
+
+def _patch_xlsx_cells(xlsx_path: str, sheet_name: str, cells: Dict[int, Dict[int, object]]) -> bool:
+    """Rewrite only the target sheet's XML inside the .xlsx; False means use openpyxl instead."""
+    tmp = xlsx_path + ".tmp"
+    try:
+        with zipfile.ZipFile(xlsx_path) as zin:
+            part = _sheet_part(zin, sheet_name)
+            if part is None:
+                return False
+            patched = _patch_sheet_xml(zin.read(part).decode("utf-8"), cells)
+            if patched is None:
+                return False
+            with zipfile.ZipFile(tmp, "w") as zout:
+                for item in zin.infolist():
+                    zout.writestr(item, patched.encode("utf-8") if item.filename == part else zin.read(item))
+        os.replace(tmp, xlsx_path)
+        return True
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return False
+
+
+def apply_json_to_excel(json_path: str, xlsx_path: str, sheet_name: str, col_indices: Dict[str, int], df: "pd.DataFrame") -> int:
+    store = load_label_store_cached(json_path)
     labels = store.get("labels", {})
-    applied = 0
-    wb = load_workbook(xlsx_path)
-    ws = wb[sheet_name]
+    # Collect the cells to write first; nothing to apply means no workbook load/save at all
+    writes: List[Tuple[int, int, str, int, object]] = []  # (row_idx, excel_row, col_name, col_idx, value)
+    col_index = col_indices.get
     for key, entry in labels.items():
         try:
             row_idx = int(key)
         except Exception:
             continue
         excel_row = row_idx + 2
-        values = entry.get("values", {})
-        for col_name, val in values.items():
-            idx = col_indices.get(col_name)
-            if idx is None:
-                continue
+        for col_name, val in entry.get("values", {}).items():
+            idx = col_index(col_name)
+            if idx is not None:
+                writes.append((row_idx, excel_row, col_name, idx, val))
+    if not writes:
+        return 0
+
+    cells: Dict[int, Dict[int, object]] = {}
+    for _row_idx, excel_row, _col_name, idx, val in writes:
+        cells.setdefault(excel_row, {})[idx] = val
+    if len(cells) < SPARSE_PATCH_RATIO * len(df) and _patch_xlsx_cells(xlsx_path, sheet_name, cells):
+        done = writes
+    else:
+        done = []
+        wb = load_workbook(xlsx_path)
+        ws = wb[sheet_name]
+        cell = ws.cell
+        for write in writes:
+            _row_idx, excel_row, _col_name, idx, val = write
             try:
-                ws.cell(row=excel_row, column=idx, value=val)
-                applied += 1
-                if col_name in df.columns:
-                    df.at[row_idx, col_name] = val
+                cell(row=excel_row, column=idx, value=val)
             except Exception:
-                pass
-    wb.save(xlsx_path)
-    wb.close()
+                continue
+            done.append(write)
+        wb.save(xlsx_path)
+        wb.close()
+    applied = len(done)
+
+    by_col: Dict[str, Tuple[List[int], List[object]]] = {}
+    for row_idx, _excel_row, col_name, _idx, val in done:
+        rows, vals = by_col.setdefault(col_name, ([], []))
+        rows.append(row_idx)
+        vals.append(val)
+
+    # Mirror into the DataFrame one column at a time instead of cell by cell
+    index = df.index
+    for col_name, (rows, vals) in by_col.items():
+        if col_name not in df.columns:
+            continue
+        pairs = [(r, v) for r, v in zip(rows, vals) if r in index]
+        if not pairs:
+            continue
+        try:
+            df.loc[[r for r, _ in pairs], col_name] = [v for _, v in pairs]
+        except Exception:
+            for r, v in pairs:
+                try:
+                    df.at[r, col_name] = v
+                except Exception:
+                    pass
     return applied
 
 
 def get_json_entry(json_path: str, row_idx: int) -> dict:
-    store = load_label_store(json_path)
+    store = load_label_store_cached(json_path)
     key = str(row_idx)
-    return store.get("labels", {}).get(key) or {}
+    # Copy: the cached store is shared, callers may edit the entry they get back
+    return copy.deepcopy(store.get("labels", {}).get(key) or {})
+
+
+# Write-behind for upsert_json_entry: edits land in the cached store and are written
+# together once no edit has arrived for LABEL_FLUSH_DELAY_MS (or on flush/exit)
+LABEL_FLUSH_DELAY_MS = 500
+_dirty_label_stores: Dict[str, dict] = {}
+_flush_timer: Optional[QtCore.QTimer] = None
+
+
+def _schedule_label_flush() -> bool:
+    """(Re)start the flush timer; False when there is no Qt application to run it."""
+    global _flush_timer
+    if QtCore.QCoreApplication.instance() is None:
+        return False
+    if _flush_timer is None:
+        _flush_timer = QtCore.QTimer()
+        _flush_timer.setSingleShot(True)
+        _flush_timer.setInterval(LABEL_FLUSH_DELAY_MS)
+        _flush_timer.timeout.connect(flush_all_label_stores)
+    _flush_timer.start()
+    return True
+
+
+def flush_label_store(json_path: str) -> bool:
+    """Write pending upserts for json_path now. Returns True if nothing is left pending."""
+    store = _dirty_label_stores.pop(json_path, None)
+    if store is None:
+        return True
+    if save_label_store(json_path, store):
+        return True
+    # Keep it dirty and try again later (the next upsert, read or exit also retries);
+    # an unreadable store stays refused until it is fixed, so no timer for that
+    _dirty_label_stores[json_path] = store
+    if json_path not in _unreadable_label_stores:
+        _schedule_label_flush()
+    return False
+
+
+def flush_all_label_stores() -> bool:
+    ok = True
+    for path in list(_dirty_label_stores):
+        ok = flush_label_store(path) and ok
+    return ok
+
+
+atexit.register(flush_all_label_stores)
 
 
 def upsert_json_entry(json_path: str, row_idx: int, updater: Dict[str, object]) -> None:
-    store = load_label_store(json_path)
+    store = load_label_store_cached(json_path)
     key = str(row_idx)
     entry = store["labels"].get(key) or {}
     for k, v in updater.items():
         entry[k] = v
     store["labels"][key] = entry
-    save_label_store(json_path, store)
+    _dirty_label_stores[json_path] = store
+    if not _schedule_label_flush():
+        flush_label_store(json_path)
 
 
-def merge_json_into_df(json_path: str, df: pd.DataFrame, label_columns: List[str]) -> None:
+def merge_json_into_df(json_path: str, df: "pd.DataFrame", label_columns: List[str]) -> None:
     """Load existing JSON labels and reflect into DataFrame so work can resume after restart."""
-    store = load_label_store(json_path)
+    import numpy as np
+    import pandas as pd
+
+    store = load_label_store_cached(json_path)
     labels = store.get("labels", {})
+    wanted = set(label_columns)
+    # col -> {row -> value}, so each column is checked and written in one go
+    per_col: Dict[str, Dict[int, object]] = {}
     for key, entry in labels.items():
         try:
             ridx = int(key)
         except Exception:
             continue
-        if ridx not in df.index:
+        for col, val in entry.get("values", {}).items():
+            if col in wanted:
+                per_col.setdefault(col, {})[ridx] = val
+    if not per_col:
+        return
+
+    index = df.index
+    if index.is_unique:
+        index_pos = index.get_indexer
+    else:
+        # Duplicated labels were never filled (df.at yields a Series there): match only unique ones
+        keep = ~index.duplicated(keep=False)
+        keep_pos = np.flatnonzero(keep)
+        unique_index = index[keep]
+
+        def index_pos(rows):
+            p = unique_index.get_indexer(rows)
+            return np.where(p >= 0, keep_pos[np.maximum(p, 0)], -1)
+
+    for col, updates in per_col.items():
+        if col not in df.columns:
+            df[col] = pd.Series(None, index=index, dtype=object)
+        rows = np.fromiter(updates.keys(), dtype=np.int64, count=len(updates))
+        vals = list(updates.values())
+        pos = index_pos(rows)
+        found = np.flatnonzero(pos >= 0)
+        if found.size == 0:
+            continue
+        current = df[col].iloc[pos[found]]
+        empty = current.isna().to_numpy() | (current.astype(str).to_numpy() == "")
+        sel = found[empty]
+        if sel.size == 0:
             continue
-        values = entry.get("values", {})
-        for col, val in values.items():
-            if col in label_columns:
+        ensure_object_dtype(df, col)
+        target = pos[sel]
+        new_vals = [vals[i] for i in sel]
+        j = df.columns.get_loc(col)
+        try:
+            df.iloc[target, j] = new_vals
+        except Exception:
+            for t, v in zip(target, new_vals):
                 try:
-                    curr = None
-                    try:
-                        curr = df.at[ridx, col]
-                    except Exception:
-                        curr = None
-                    is_empty = (curr is None) or (str(curr) == "")
-                    try:
-                        if not is_empty:
-                            is_empty = bool(pd.isna(curr))
-                    except Exception:
-                        pass
-                    if is_empty:
-                        df.at[ridx, col] = val
+                    df.iat[t, j] = v
                 except Exception:
                     pass
 
+
 def is_xlsx(path: str) -> bool:
     try:
         return os.path.isfile(path) and path.lower().endswith(".xlsx")
@@ -297,29 +832,113 @@ def is_xlsx(path: str) -> bool:
         return False
 
 
-def thumb_cache_path(images_base: str, resolved_path: str, target_edge: int) -> str:
-    rel = os.path.relpath(resolved_path, images_base)
-    key = hashlib.md5(f"{rel}|{target_edge}".encode("utf-8")).hexdigest()
+# Thumbnail cache directories already created by this process
+_ENSURED_DIRS: set = set()
+# Primed once; copying it is cheaper than constructing a new hash object per thumbnail
+_THUMB_HASH = hashlib.blake2b(b"thumb-v1|", digest_size=12)
+
+
+def thumb_cache_path(images_base: str, resolved_path: str, target_edge: int, st: Optional[os.stat_result] = None) -> str:
+    """Thumbnail path keyed by the source file's identity and version, not its path.
+
+    Pass the source's os.stat() result as `st` when already at hand. A modified source
+    gets a new key, so an existing thumbnail file is always current.
+    """
+    if st is None:
+        st = os.stat(resolved_path)
+    h = _THUMB_HASH.copy()
+    h.update(f"{st.st_dev}|{st.st_ino}|{st.st_size}|{st.st_mtime_ns}|{target_edge}".encode("utf-8"))
+    key = h.hexdigest()
     cache_dir = os.path.join(images_base, ".thumb_cache")
-    os.makedirs(cache_dir, exist_ok=True)
-    return os.path.join(cache_dir, f"{key}.png")
+    if cache_dir not in _ENSURED_DIRS:
+        os.makedirs(cache_dir, exist_ok=True)
+        _ENSURED_DIRS.add(cache_dir)
+    return os.path.join(cache_dir, f"{key}{_thumb_suffix()}")
+
+
+@lru_cache(maxsize=1)
+def _thumb_suffix() -> str:
+    """.webp when it can be both written (Pillow) and read back (Qt plugin), else .png."""
+    try:
+        from PIL import features
+        pil_webp = PILImage is not None and features.check("webp")
+    except Exception:
+        pil_webp = False
+    qt_webp = b"webp" in [bytes(f) for f in QtGui.QImageReader.supportedImageFormats()]
+    return ".webp" if pil_webp and qt_webp else ".png"
+
+
+def _encode_thumb(src_path: str, dst_path: str, target_edge: int, fmt: str) -> bool:
+    """Downscale with Pillow (LANCZOS) and write dst_path as fmt ("WEBP" or "PNG")."""
+    if PILImage is None:
+        return False
+    try:
+        with PILImage.open(src_path) as im:
+            im.thumbnail((target_edge, target_edge), PILImage.LANCZOS)
+            if im.mode not in ("RGB", "RGBA"):
+                im = im.convert("RGBA" if "A" in im.getbands() or "transparency" in im.info else "RGB")
+            if fmt == "WEBP":
+                im.save(dst_path, "WEBP", quality=80, method=4)
+            else:
+                im.save(dst_path, "PNG")
+        return True
+    except Exception:
+        return False
 
 
 def build_thumb_if_needed(images_base: str, resolved_path: str, target_edge: int) -> str:
-    thumb = thumb_cache_path(images_base, resolved_path, target_edge)
+    tmp = None
     try:
-        src_mtime = os.path.getmtime(resolved_path)
-        if os.path.exists(thumb) and os.path.getmtime(thumb) >= src_mtime:
+        thumb = thumb_cache_path(images_base, resolved_path, target_edge, os.stat(resolved_path))
+        if os.path.exists(thumb):
             return thumb
-        # Use Qt to scale and save
-        img = QtGui.QImage(resolved_path)
-        if img.isNull():
+        # Already small enough: use the source itself rather than writing a same-size copy
+        size = QtGui.QImageReader(resolved_path).size()
+        if size.isValid() and max(size.width(), size.height()) <= target_edge:
             return resolved_path
-        w, h = img.width(), img.height()
-        scale = target_edge / float(max(w, h))
-        if scale < 1.0:
+        # Encode into a private temp file and rename, so readers (and concurrent
+        # builders of the same thumbnail) never see a half-written file
+        fmt = "WEBP" if thumb.endswith(".webp") else "PNG"
+        tmp = f"{thumb}.{os.getpid()}.{threading.get_ident()}.tmp"
+        if not _encode_thumb(resolved_path, tmp, target_edge, fmt):
+            # Fallback: Qt scales and encodes
+            img = QtGui.QImage(resolved_path)
+            if img.isNull():
+                return resolved_path
+            w, h = img.width(), img.height()
+            scale = target_edge / float(max(w, h))
+            if scale >= 1.0:
+                return resolved_path
             img = img.scaled(int(w * scale), int(h * scale), QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-        img.save(thumb, "PNG")
+            if not img.save(tmp, fmt):
+                return resolved_path
+        os.replace(tmp, thumb)
+        tmp = None
         return thumb
     except Exception:
         return resolved_path
+    finally:
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+
+# Upper bound on prebuild_thumbs threads: decoding is C code, but the disk is shared
+THUMB_PREBUILD_MAX_WORKERS = 8
+
+
+def prebuild_thumbs(images_base: str, resolved_paths: List[str], target_edge: int, max_workers: Optional[int] = None) -> List[str]:
+    """build_thumb_if_needed over many images in a thread pool; results keep input order.
+
+    Decoding, scaling and encoding run in Pillow/Qt C code, so the threads overlap well.
+    """
+    if not resolved_paths:
+        return []
+    workers = max(1, min(max_workers or min(THUMB_PREBUILD_MAX_WORKERS, os.cpu_count() or 4), len(resolved_paths)))
+    n = len(resolved_paths)
+    # Probe the thumbnail format here first: Qt's image plugin scan is not safe to race
+    _thumb_suffix()
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(build_thumb_if_needed, [images_base] * n, resolved_paths, [target_edge] * n))